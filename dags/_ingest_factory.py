@@ -0,0 +1,104 @@
+"""
+Shared builder for the market data ingestion DAGs.
+
+Each DAG file in this folder only declares its id and the providers it
+ingests from; the DAG and its Docker tasks are built here. Airflow skips this
+module when scanning for DAGs (see .airflowignore) and the DAG files share the
+copy cached in sys.modules, so the operator imports happen once per parse.
+"""
+from datetime import datetime, timedelta
+from airflow import DAG
+from airflow.operators.bash import BashOperator
+from airflow.providers.docker.operators.docker import DockerOperator
+
+IMAGE = 'market-analysis:latest'
+
+DEFAULT_ARGS = {
+    'owner': 'airflow',
+    'depends_on_past': False,
+    'email_on_failure': False,
+    'email_on_retry': False,
+    'retries': 1,
+    'retry_delay': timedelta(minutes=5),
+}
+
+PROVIDERS = {
+    'ibkr': {
+        'command': (
+            "python src/main.py --symbol AAPL --provider ibkr"
+            " --host $IB_HOST --port $IB_PORT --client_id $IB_CLIENT_ID"
+            " --days 5"
+        ),
+        'environment': {
+            'IB_HOST': '{{ var.value.IB_HOST | default("localhost") }}',
+            'IB_PORT': '{{ var.value.IB_PORT | default(7496) }}',
+            'IB_CLIENT_ID': '{{ var.value.IB_CLIENT_ID | default(1) }}',
+        },
+    },
+    'binance': {
+        'command': (
+            "python src/main.py --symbol BTCUSDT --provider binance"
+            " --api_key $BINANCE_API_KEY --api_secret $BINANCE_API_SECRET"
+            " --days 5"
+        ),
+        'environment': {
+            'BINANCE_API_KEY': '{{ var.value.BINANCE_API_KEY }}',
+            'BINANCE_API_SECRET': '{{ var.value.BINANCE_API_SECRET }}',
+        },
+    },
+}
+
+
+def make_ingest_dag(
+    dag_id: str, tasks: list, description: str, tags: list
+) -> DAG:
+    """
+    Build an ingestion DAG that runs one DockerOperator per task spec.
+
+    Each spec is a dict with a ``task_id`` and a ``provider`` key from
+    PROVIDERS. Tasks run in the order given, after the image pull.
+    """
+    dag = DAG(
+        dag_id,
+        default_args=DEFAULT_ARGS,
+        description=description,
+        schedule_interval=None,
+        start_date=datetime(2023, 1, 1),
+        catchup=False,
+        max_active_runs=1,
+        tags=tags
+    )
+
+    # Pull the image only when the worker doesn't already have it, so the
+    # Docker tasks start from the local image cache instead of the registry
+    upstream = BashOperator(
+        task_id='pull_image',
+        bash_command=(
+            f'docker image inspect {IMAGE} > /dev/null 2>&1'
+            f' || docker pull {IMAGE}'
+        ),
+        dag=dag,
+    )
+
+    for spec in tasks:
+        provider = PROVIDERS[spec['provider']]
+        task = DockerOperator(
+            task_id=spec['task_id'],
+            image=IMAGE,
+            api_version='auto',
+            auto_remove=True,
+            force_pull=False,
+            mount_tmp_dir=False,
+            tty=False,
+            docker_url='unix:///var/run/docker.sock',
+            command=provider['command'],
+            environment=provider['environment'],
+            network_mode='bridge',
+            dag=dag,
+            pool='market_data',
+            execution_timeout=timedelta(minutes=30),
+        )
+        upstream >> task
+        upstream = task
+
+    return dag
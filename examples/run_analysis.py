@@ -11,9 +11,11 @@ This script demonstrates our unsupervised market state analysis approach:
 6. Visualize the results with state transitions
 
 Run this script directly to see the analysis in action:
-python run_analysis.py
+python run_analysis.py --symbol AAPL --days 90
 """
 
+import argparse
+import asyncio
 import sys
 import os
 import numpy as np
@@ -26,37 +28,56 @@ sys.path.append(project_root)
 
 from src.market_analysis import MarketAnalyzer
 
+# Above this many rows intraday bars are resampled to hourly before analysis
+MAX_ROWS = 20_000
+
+OHLCV_AGG = {
+    'open': 'first',
+    'high': 'max',
+    'low': 'min',
+    'close': 'last',
+    'volume': 'sum',
+}
+
+def downsample(data, max_rows=MAX_ROWS):
+    """Resample intraday OHLCV bars to hourly when there are too many rows"""
+    if len(data) <= max_rows or not isinstance(data.index, pd.DatetimeIndex):
+        return data
+    agg = {col: how for col, how in OHLCV_AGG.items() if col in data.columns}
+    return data.resample('1h').agg(agg).dropna()
+
 def analyze_market_states(analyzer, signals):
     """Analyze and print characteristics of each market state"""
-    print("\nMarket State Analysis:")
-    print("=====================")
-    
-    for state, chars in signals['state_characteristics'].items():
-        print(f"\nState {state}:")
-        print("Characteristics:")
-        for key, value in chars.items():
-            print(f"  - {key}: {value:.3f}")
-            
-        # Determine typical behavior in this state
-        volatility = chars['volatility']
-        trend = chars['trend_strength']
-        volume = chars['volume']
-        
-        print("Typical Behavior:")
-        print(f"  - Volatility: {'High' if volatility > 0.5 else 'Low'}")
-        print(f"  - Trend: {'Strong' if abs(trend) > 0.5 else 'Weak'} "
-              f"({'Upward' if trend > 0 else 'Downward'})")
-        print(f"  - Volume: {'Above' if volume > 1 else 'Below'} average")
+    states = pd.DataFrame.from_dict(signals['state_characteristics'], orient='index')
+    states.index.name = 'state'
+
+    # Determine typical behavior in each state
+    trend = states['trend_strength']
+    states['volatility_level'] = np.where(states['volatility'] > 0.5, 'High', 'Low')
+    states['trend'] = (
+        pd.Series(np.where(trend.abs() > 0.5, 'Strong', 'Weak'), index=states.index)
+        + np.where(trend > 0, ' (Upward)', ' (Downward)')
+    )
+    states['volume_vs_avg'] = np.where(states['volume'] > 1, 'Above', 'Below')
+
+    print("\nMarket State Analysis:\n"
+          "=====================\n"
+          + states.to_string(float_format='%.3f'))
 
 def main():
-    # Initialize analyzer with Apple stock
-    symbol = 'AAPL'
+    parser = argparse.ArgumentParser(description='State-aware market analysis example')
+    parser.add_argument('--symbol', default='AAPL', help='Market symbol to analyze')
+    parser.add_argument('--days', type=int, default=90, help='Number of days of historical data')
+    args = parser.parse_args()
+
+    symbol = args.symbol
     analyzer = MarketAnalyzer(symbol)
     
-    # Fetch one year of historical data
+    # Fetch only the window needed for state identification
     end_date = datetime.now()
-    start_date = end_date - timedelta(days=365)
-    analyzer.fetch_data(start_date, end_date)
+    start_date = end_date - timedelta(days=args.days)
+    asyncio.run(analyzer.fetch_data(start_date, end_date))
+    analyzer.data = downsample(analyzer.data)
     
     # Identify market states using unsupervised learning
     print(f"\nAnalyzing market states for {symbol}...")
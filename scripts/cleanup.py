@@ -5,57 +5,120 @@ Cleanup script to remove Python cache files and other development artifacts.
 
 import os
 import shutil
-import glob
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Names of files/directories to remove wherever they appear
+ARTIFACT_NAMES = frozenset({
+    "__pycache__",
+    ".pytest_cache",
+    ".coverage",
+    "htmlcov",
+    ".tox",
+    "dist",
+    "build",
+    ".eggs",
+    ".mypy_cache",
+    ".hypothesis",
+})
+
+# Suffixes of files/directories to remove wherever they appear
+ARTIFACT_SUFFIXES = (".pyc", ".pyo", ".pyd", ".egg-info", ".egg")
+
+# Install locations whose bytecode is precompiled at image build time
+PROTECTED_ROOTS = (Path("/app"), Path("/opt"))
+
+# Removals are I/O-bound, so run many of them at once
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def is_artifact(name):
+    """Check whether a file or directory name is a development artifact."""
+    return name in ARTIFACT_NAMES or name.endswith(ARTIFACT_SUFFIXES)
+
+
+def find_artifacts(root):
+    """Yield artifact entries under root in a single directory walk.
+
+    Matched directories are not descended into, and neither are other
+    hidden directories such as .git.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError as e:
+        print(f"Error scanning {root}: {e}")
+        return
+
+    for entry in entries:
+        if is_artifact(entry.name):
+            yield entry
+        elif (entry.is_dir(follow_symlinks=False)
+              and not entry.name.startswith(".")):
+            yield from find_artifacts(entry.path)
+
+
+def remove_path(path):
+    """Remove a file or directory tree, returning the error if it fails."""
+    try:
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+    except Exception as e:
+        return e
+    return None
+
+
 def cleanup_project():
     """Remove Python cache files and other development artifacts."""
     # Get the project root directory (parent of scripts directory)
     project_root = Path(__file__).parent.parent
-    
-    # Patterns for files/directories to remove
-    patterns = [
-        "**/__pycache__",
-        "**/*.pyc",
-        "**/*.pyo",
-        "**/*.pyd",
-        "**/.pytest_cache",
-        "**/.coverage",
-        "**/htmlcov",
-        "**/.tox",
-        "**/*.egg-info",
-        "**/*.egg",
-        "**/dist",
-        "**/build",
-        "**/.eggs",
-        "**/.mypy_cache",
-        "**/.hypothesis",
-    ]
+
+    resolved_root = project_root.resolve()
+    if any(
+        resolved_root == root or root in resolved_root.parents
+        for root in PROTECTED_ROOTS
+    ):
+        print(
+            f"Skipping cleanup of {project_root}: "
+            "precompiled install location"
+        )
+        return
 
     total_removed = 0
-    
+
     print(f"Cleaning up project at: {project_root}")
     print("-" * 50)
 
-    for pattern in patterns:
-        # Use glob to find all matching paths
-        matches = glob.glob(str(project_root / pattern), recursive=True)
-        
-        for path in matches:
-            try:
-                if os.path.isfile(path):
-                    os.remove(path)
-                    print(f"Removed file: {path}")
-                    total_removed += 1
-                elif os.path.isdir(path):
-                    shutil.rmtree(path)
-                    print(f"Removed directory: {path}")
-                    total_removed += 1
-            except Exception as e:
-                print(f"Error removing {path}: {e}")
+    # Split targets so directories and files go to the matching remover
+    dir_targets = []
+    file_targets = []
+    for entry in find_artifacts(project_root):
+        if entry.is_dir(follow_symlinks=False):
+            dir_targets.append(entry.path)
+        else:
+            file_targets.append(entry.path)
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        dir_errors = list(executor.map(remove_path, dir_targets))
+        file_errors = list(executor.map(remove_path, file_targets))
+
+    # Report from the main thread so output stays ordered
+    for kind, paths, errors in (
+        ("directory", dir_targets, dir_errors),
+        ("file", file_targets, file_errors),
+    ):
+        for path, error in zip(paths, errors):
+            if error is None:
+                print(f"Removed {kind}: {path}")
+                total_removed += 1
+            else:
+                print(f"Error removing {path}: {error}")
 
     print("-" * 50)
     print(f"Cleanup complete! Removed {total_removed} items.")
 
+
 if __name__ == "__main__":
     cleanup_project()
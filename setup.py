@@ -2,18 +2,27 @@
 from setuptools import setup, find_namespace_packages
 from pathlib import Path
 
-def read_requirements(filename: str) -> list[str]:
-    """Read requirements from a file."""
-    reqs_path = Path(__file__).parent / "requirements" / filename
-    with open(reqs_path, "r") as f:
-        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+def read_all_requirements() -> dict[str, list[str]]:
+    """Read every requirements file once, keyed by file stem."""
+    reqs_dir = Path(__file__).parent / "requirements"
+    return {
+        path.stem: [
+            line.strip() for line in path.read_text().splitlines()
+            if line.strip() and not line.startswith("#")
+        ]
+        for path in reqs_dir.glob("requirements-*.txt")
+    }
+
+
+REQUIREMENTS = read_all_requirements()
 
 # Read core requirements
-install_requires = read_requirements("requirements-core.txt")
+install_requires = REQUIREMENTS["requirements-core"]
 
 # Read provider-specific requirements
-ibrokers_requires = read_requirements("requirements-ibrokers.txt")
-binance_requires = read_requirements("requirements-binance.txt")
+ibrokers_requires = REQUIREMENTS["requirements-ibrokers"]
+binance_requires = REQUIREMENTS["requirements-binance"]
 
 # All providers combined
 all_requires = ibrokers_requires + binance_requires
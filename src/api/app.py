@@ -1,59 +1,463 @@
 """
 FastAPI application implementation for market analysis.
 """
-from fastapi import FastAPI, HTTPException, WebSocket
+from fastapi import Depends, FastAPI, HTTPException, Request, WebSocket
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager, suppress
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Optional
 from prometheus_fastapi_instrumentator import Instrumentator
+from pydantic import TypeAdapter, ValidationError
+from cachetools import TTLCache
+import asyncio
+import math
+import weakref
 import time
 import os
 import psutil
 import logging
-import pandas as pd
+import orjson
 import numpy as np
 
-from src.market_analysis import MarketAnalyzer
 from src.api.models.analysis import (
     AnalysisRequest,
     AnalysisResult,
+    BatchAnalysisRequest,
+    SignalThresholds,
     TechnicalIndicator,
     TradingSignal,
     MarketState
 )
 from src.api.models.health import HealthResponse, SystemMetrics
+from src.api.responses import ORJSON_OPTIONS, ORJSONResponse
+from src.api.logging_config import configure_logging
+from src.api.metrics import analysis_counter
+from src.api.middleware.concurrent_limiter import ConcurrentRequestLimiter
 from src.api.middleware.rate_limiter import RateLimiter
 from src.api.websocket.handlers import handle_market_subscription
 from src.api.queue.queue_manager import QueueManager
 from src.api.queue.redis_client import RedisClient
 from src.api.routers import health
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from src.data_providers import MarketDataProvider
+    from src.market_analysis import MarketAnalyzer
+
 logger = logging.getLogger(__name__)
 
+# Failures of signal generation on bad or too little data. The analysis
+# is still returned without signals; anything else is a server error.
+SIGNAL_ERRORS = (ValueError, KeyError, TypeError, IndexError, np.linalg.LinAlgError)
+
+# Path patterns left out of the request latency metrics
+PROMETHEUS_EXCLUDED_HANDLERS = ["/health", "/metrics"]
+
+# Analyzer series reported as the current value of each request indicator
+INDICATOR_SERIES = {
+    'RSI': 'rsi',
+    'MACD': 'macd',
+    'BB': 'bb_mid',
+    'STOCH': 'stoch_k'
+}
+
+# Indicator names accepted by /analyze, in upper case
+SUPPORTED_INDICATORS: frozenset = frozenset(INDICATOR_SERIES)
+
+# SignalThresholds fields (upper, lower) reported with each indicator.
+# Indicators without overbought/oversold levels report no thresholds.
+INDICATOR_THRESHOLD_KEYS = {
+    'RSI': ('rsi_overbought', 'rsi_oversold'),
+    'STOCH': ('stoch_overbought', 'stoch_oversold')
+}
+NO_THRESHOLDS = (None, None)
+
+# Thresholds used when a request gives none, validated once at import
+DEFAULT_THRESHOLDS = SignalThresholds()
+
+# Dumps a whole batch of results in one pydantic-core call
+ANALYSIS_RESULTS_ADAPTER = TypeAdapter(List[AnalysisResult])
+
+# Warm MarketAnalyzer instances keyed by symbol. Entries expire after
+# ANALYZER_CACHE_TTL seconds without use and the least recently used
+# analyzer is evicted once ANALYZER_CACHE_SIZE symbols are cached.
+ANALYZER_CACHE_SIZE = int(os.getenv("ANALYZER_CACHE_SIZE", 256))
+ANALYZER_CACHE_TTL = int(os.getenv("ANALYZER_CACHE_TTL", 1800))
+market_analyzers: TTLCache = TTLCache(maxsize=ANALYZER_CACHE_SIZE, ttl=ANALYZER_CACHE_TTL)
+
+# Market data frames keyed by (symbol, start, end) with the window
+# rounded to the minute. A short TTL lets bursts of identical requests
+# share one provider round trip without serving stale prices for long.
+MARKET_DATA_CACHE_SIZE = int(os.getenv("MARKET_DATA_CACHE_SIZE", 1024))
+MARKET_DATA_CACHE_TTL = int(os.getenv("MARKET_DATA_CACHE_TTL", 60))
+market_data_cache: TTLCache = TTLCache(maxsize=MARKET_DATA_CACHE_SIZE, ttl=MARKET_DATA_CACHE_TTL)
+
+# Technical indicators keyed like market_data_cache and stored with the
+# frame they were computed from and the latest value of each series, so a
+# repeated window for a symbol skips the provider, the indicator recompute
+# and the per-series lookups.
+INDICATOR_CACHE_SIZE = int(os.getenv("INDICATOR_CACHE_SIZE", 512))
+INDICATOR_CACHE_TTL = int(os.getenv("INDICATOR_CACHE_TTL", 60))
+indicator_cache: TTLCache = TTLCache(maxsize=INDICATOR_CACHE_SIZE, ttl=INDICATOR_CACHE_TTL)
+
+# Finished /analyze results keyed by the full request and the current
+# minute, so repeated polls within a minute skip the pipeline entirely.
+ANALYSIS_CACHE_SIZE = int(os.getenv("ANALYSIS_CACHE_SIZE", 512))
+ANALYSIS_CACHE_TTL = int(os.getenv("ANALYSIS_CACHE_TTL", 60))
+analysis_cache: TTLCache = TTLCache(maxsize=ANALYSIS_CACHE_SIZE, ttl=ANALYSIS_CACHE_TTL)
+
+# Worker threads for asyncio.to_thread, which runs provider I/O and the
+# indicator, state and signal stages. The asyncio default of cpu_count + 4
+# lets a few slow fetches starve the CPU stages of other requests.
+ANALYSIS_THREADS = int(os.getenv("ANALYSIS_THREADS", 64))
+
+# Analyses a single client may have in flight at once, enforced through
+# Redis when both the queue and the rate limiter are enabled
+MAX_CONCURRENT_ANALYSES = int(os.getenv("MAX_CONCURRENT_ANALYSES", 4))
+
+# /analyze switches to an NDJSON response when more signals than this
+# would be returned and the client didn't choose a format
+STREAM_SIGNALS_THRESHOLD = int(os.getenv("STREAM_SIGNALS_THRESHOLD", 5000))
+
+# Per-key locks so concurrent cache misses for the same key do the work
+# once. Locks are dropped as soon as no request holds them.
+_analyzer_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+_market_data_locks: "weakref.WeakValueDictionary[tuple, asyncio.Lock]" = weakref.WeakValueDictionary()
+_analysis_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+# Market data provider shared by every analyzer so its client session or
+# broker connection is reused across symbols. Created on first use.
+_provider: Optional["MarketDataProvider"] = None
+
+def get_provider() -> "MarketDataProvider":
+    """Get the process-wide market data provider, creating it on first use."""
+    global _provider
+    if _provider is None:
+        from src.data_providers import provider_factory
+        _provider = provider_factory()
+    return _provider
+
+async def close_provider() -> None:
+    """Close the shared provider's connections, if it was ever created."""
+    global _provider
+    if _provider is not None:
+        provider, _provider = _provider, None
+        await provider.close()
+
+def _get_lock(locks: weakref.WeakValueDictionary, key) -> asyncio.Lock:
+    """Get the lock for a key, creating it if no request currently holds one."""
+    lock = locks.get(key)
+    if lock is None:
+        lock = locks[key] = asyncio.Lock()
+    return lock
+
+async def get_analyzer(symbol: str) -> "MarketAnalyzer":
+    """Get a cached MarketAnalyzer for a symbol, creating it on first use.
+
+    Every hit re-inserts the analyzer so its TTL is measured from last use.
+    """
+    analyzer = market_analyzers.get(symbol)
+    if analyzer is None:
+        async with _get_lock(_analyzer_locks, symbol):
+            analyzer = market_analyzers.get(symbol)
+            if analyzer is None:
+                # Imported on first use so the analysis stack (pandas, sklearn,
+                # ta, yfinance) doesn't slow down worker startup
+                from src.market_analysis import MarketAnalyzer
+                analyzer = MarketAnalyzer(symbol, test_mode=True, provider=get_provider())
+    market_analyzers[symbol] = analyzer
+    return analyzer
+
+def analysis_cache_key(request: AnalysisRequest, now: datetime) -> tuple:
+    """Build the analysis cache key for a request in the minute of ``now``."""
+    return (request.model_dump_json(), int(now.timestamp() // 60))
+
+def _floor_minute(value: Optional[datetime]) -> Optional[datetime]:
+    """Round a timestamp down to the minute so nearby requests share a key."""
+    return value.replace(second=0, microsecond=0) if value is not None else None
+
+async def get_market_data(
+    analyzer: "MarketAnalyzer",
+    start_time: Optional[datetime],
+    end_time: Optional[datetime]
+) -> "pd.DataFrame":
+    """Fetch market data for an analyzer through the shared data cache.
+
+    On a hit the cached frame is bound to the analyzer without touching the
+    provider; concurrent misses for the same key share a single fetch.
+    """
+    start_time = _floor_minute(start_time)
+    end_time = _floor_minute(end_time)
+    key = (analyzer.symbol, start_time, end_time)
+
+    data = market_data_cache.get(key)
+    if data is None:
+        async with _get_lock(_market_data_locks, key):
+            data = market_data_cache.get(key)
+            if data is None:
+                data = await analyzer.fetch_data(start_time, end_time)
+                data = data.copy(deep=False)
+                market_data_cache[key] = data
+    analyzer.reset(data)
+    return data
+
+async def prefetch_market_data(
+    analyzers: List["MarketAnalyzer"],
+    start_time: Optional[datetime],
+    end_time: Optional[datetime]
+) -> None:
+    """Fill the market data cache for several analyzers with one provider call.
+
+    Symbols whose window is already cached are skipped; the rest are fetched
+    together through the shared provider's ``fetch_data_batch``.
+    """
+    start_time = _floor_minute(start_time)
+    end_time = _floor_minute(end_time)
+    missing = [
+        analyzer for analyzer in analyzers
+        if (analyzer.symbol, start_time, end_time) not in market_data_cache
+    ]
+    if not missing:
+        return
+
+    frames = await get_provider().fetch_data_batch(
+        [analyzer.symbol for analyzer in missing], start_time, end_time
+    )
+    for analyzer in missing:
+        key = (analyzer.symbol, start_time, end_time)
+        market_data_cache[key] = analyzer.standardize_columns(frames[analyzer.symbol])
+
+def check_indicators(indicators: List[str]) -> List[str]:
+    """Return the upper-cased indicator names, rejecting unsupported ones.
+
+    Names are matched case-insensitively; any name outside
+    SUPPORTED_INDICATORS fails the request with a 400.
+    """
+    indicators_up = [name.upper() for name in indicators]
+    # issuperset walks the list without building a set on the common path
+    if not SUPPORTED_INDICATORS.issuperset(indicators_up):
+        unsupported = set(indicators_up) - SUPPORTED_INDICATORS
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported indicators: {', '.join(sorted(unsupported))}"
+        )
+    return indicators_up
+
+def query_thresholds(request: Request) -> SignalThresholds:
+    """Read signal thresholds from the query string of a GET request.
+
+    Any SignalThresholds field may be given as a query parameter; requests
+    without one share DEFAULT_THRESHOLDS. Invalid values are reported as a
+    422 like any other request validation error.
+    """
+    params = request.query_params
+    values = {name: params[name] for name in SignalThresholds.model_fields if name in params}
+    if not values:
+        return DEFAULT_THRESHOLDS
+    try:
+        return SignalThresholds.model_validate(values)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+def select_signals(signals_data: Dict, min_strength: float = 0.1, limit: Optional[int] = None):
+    """Select the bars that carry a trading signal.
+
+    Bars are filtered with a single NumPy mask on the absolute composite
+    signal, and only the ``limit`` most recent survivors are kept before
+    any per-signal work. Returns chronological positions, BUY/SELL labels
+    and confidences clipped to [0, 1].
+    """
+    composite = np.asarray(signals_data['composite_signal'], dtype=np.float64)
+    confidence = np.asarray(signals_data['confidence'], dtype=np.float64)
+
+    positions = np.flatnonzero(np.abs(composite) > min_strength)
+    if limit is not None:
+        positions = positions[max(positions.size - limit, 0):]
+    signal_types = np.where(composite[positions] > 0, "BUY", "SELL")
+    # Only the selected bars need their confidence clipped
+    return positions, signal_types, np.clip(confidence[positions], 0.0, 1.0)
+
+def build_trading_signals(
+    index: "pd.Index",
+    signals_data: Dict,
+    indicators: List[str],
+    min_strength: float = 0.1,
+    limit: Optional[int] = None
+) -> List[TradingSignal]:
+    """Convert composite signal arrays into TradingSignal models, newest first.
+
+    Only the ``limit`` most recent signals are materialized. The values come
+    straight from select_signals, so models are built without validation.
+    """
+    positions, signal_types, confidences = select_signals(signals_data, min_strength, limit)
+    positions, signal_types, confidences = positions[::-1], signal_types[::-1], confidences[::-1]
+    timestamps = index[positions].to_pydatetime()
+
+    return [
+        TradingSignal.model_construct(
+            timestamp=timestamp,
+            signal_type=signal_type,
+            confidence=conf,
+            indicators=indicators
+        )
+        for timestamp, signal_type, conf in zip(timestamps, signal_types.tolist(), confidences.tolist())
+    ]
+
+def last_value(series: "pd.Series") -> float:
+    """Return the last value of a series, or NaN if it is empty.
+
+    Reads the underlying array directly instead of going through the
+    ``iloc`` indexer.
+    """
+    values = series.to_numpy()
+    return values[-1] if values.size else np.nan
+
+def clean_array(values) -> np.ndarray:
+    """Convert values to a float64 array with every non-finite entry set to NaN."""
+    values = np.array(values, dtype=np.float64)
+    values[~np.isfinite(values)] = np.nan
+    return values
+
 def clean_float(value):
-    """Convert float to JSON-serializable value, handling NaN and infinite values."""
-    if isinstance(value, (int, float)):
-        if pd.isna(value) or np.isinf(value):
-            return None
-        return float(value)
+    """Convert float to JSON-serializable value, handling NaN and infinite values.
+
+    Scalars are checked with math.isfinite, which avoids NumPy ufunc dispatch;
+    use clean_array for whole series.
+    """
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return float(value) if math.isfinite(value) else None
     return value
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+@contextmanager
+def translate_errors(action: str, symbol: Optional[str] = None):
+    """Translate pipeline exceptions into HTTP errors.
+
+    HTTPExceptions pass through, ValueErrors become 400s and anything else
+    is logged and becomes a 500. With ``symbol`` the failure is also
+    recorded in analysis_counter.
+    """
+    try:
+        yield
+    except HTTPException:
+        raise
+    except Exception as e:
+        if symbol is not None:
+            analysis_counter.labels(symbol=symbol, status="error").inc()
+        if isinstance(e, ValueError):
+            raise HTTPException(status_code=400, detail=str(e))
+        logger.error("Error %s: %s", action, e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+async def prewarm_analyzers(symbols: List[str]) -> None:
+    """Populate the analyzer cache for frequently requested symbols.
+
+    Each symbol gets a cached analyzer and a small throwaway fetch over the
+    last two days so the provider session is established before the first
+    real request arrives. Failures are logged and never block startup.
+    """
+    end_date = datetime.now(timezone.utc)
+    start_date = end_date - timedelta(days=2)
+
+    async def warm(symbol: str) -> None:
+        try:
+            analyzer = await get_analyzer(symbol)
+            await analyzer.fetch_data(start_date, end_date)
+        except Exception as e:
+            logger.warning("Failed to prewarm analyzer for %s: %s", symbol, e)
+
+    await asyncio.gather(*(warm(symbol) for symbol in symbols))
+
+def warm_analysis_pipeline(rows: int = 256) -> None:
+    """Run the full analysis pipeline once on synthetic bars.
+
+    The first request otherwise pays for importing the analysis stack and
+    for the first call into each ta indicator and sklearn estimator.
+    """
+    import pandas as pd
+    from src.market_analysis import MarketAnalyzer
+
+    rng = np.random.default_rng(0)
+    close = 100 + rng.standard_normal(rows).cumsum()
+    analyzer = MarketAnalyzer("WARMUP", test_mode=True, provider=get_provider())
+    analyzer.data = pd.DataFrame({
+        'open': close,
+        'high': close + 1,
+        'low': close - 1,
+        'close': close,
+        'volume': rng.uniform(1e6, 2e6, rows)
+    }, index=pd.date_range(end=datetime.now(timezone.utc), periods=rows, freq='D'))
+    analyzer.calculate_technical_indicators()
+    analyzer.identify_market_states()
+    analyzer.generate_trading_signals()
+
+async def warm_pipeline_in_background() -> None:
+    """Warm the analysis pipeline without holding up startup."""
+    try:
+        await asyncio.to_thread(warm_analysis_pipeline)
+    except Exception as e:
+        logger.warning("Failed to warm analysis pipeline: %s", e)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown hooks."""
+    executor = ThreadPoolExecutor(max_workers=ANALYSIS_THREADS, thread_name_prefix="analysis")
+    asyncio.get_running_loop().set_default_executor(executor)
+
+    symbols = [s.strip() for s in os.getenv("PREWARM_SYMBOLS", "").split(",") if s.strip()]
+    if symbols:
+        logger.info("Prewarming analyzers for: %s", ', '.join(symbols))
+        await prewarm_analyzers(symbols)
+    # Runs after startup so /health stays fast while the stack loads.
+    warmup = None
+    if app.state.warm_pipeline:
+        warmup = app.state.pipeline_warmup = asyncio.create_task(warm_pipeline_in_background())
+    yield
+    if warmup is not None:
+        warmup.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup
+    await close_provider()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+def create_app(
+    test_mode: bool = False,
+    enable_queue: bool = True,
+    enable_rate_limiter: Optional[bool] = None,
+    enable_prometheus: Optional[bool] = None,
+    warm_pipeline: Optional[bool] = None
+) -> FastAPI:
+    """Create FastAPI application.
+
+    Every API entry point builds its app here. The rate limiter and
+    Prometheus instrumentation default to on outside test mode; without the
+    queue the WebSocket subscription endpoint is not registered. The analysis
+    pipeline is warmed at startup unless ``warm_pipeline`` is False or, when
+    it is not given, WARM_ANALYSIS_PIPELINE is set to anything but "1".
+    """
+    if enable_rate_limiter is None:
+        enable_rate_limiter = not test_mode
+    if enable_prometheus is None:
+        enable_prometheus = not test_mode
+    if warm_pipeline is None:
+        warm_pipeline = os.getenv("WARM_ANALYSIS_PIPELINE", "1") == "1"
+
+    configure_logging()
 
-def create_app(test_mode: bool = False) -> FastAPI:
-    """Create FastAPI application."""
     app = FastAPI(
         title="Market Analysis API",
         description="API for technical analysis and market state detection",
-        version="1.0.0"
+        version="1.0.0",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan
     )
     
     # Add start time for uptime tracking
     app.start_time = time.time()
+    app.state.warm_pipeline = warm_pipeline
     
     # Add CORS middleware
     app.add_middleware(
@@ -64,35 +468,47 @@ def create_app(test_mode: bool = False) -> FastAPI:
         allow_headers=["*"],
     )
     
-    # Add rate limiter middleware
-    if not test_mode:
-        app.add_middleware(RateLimiter)
-
-    # Initialize Redis client
-    redis_client = RedisClient(
-        host=os.getenv("REDIS_HOST", "localhost"),
-        port=int(os.getenv("REDIS_PORT", 6379))
-    )
+    # Compress larger responses; analysis JSON with signal histories is
+    # highly repetitive. Level 5 keeps most of the ratio at far less CPU.
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+    redis_client = None
+    if enable_queue:
+        # Initialize Redis client
+        redis_client = RedisClient(
+            host=os.getenv("REDIS_HOST", "localhost"),
+            port=int(os.getenv("REDIS_PORT", 6379))
+        )
+
+        # Initialize queue manager
+        app.queue_manager = QueueManager(redis_client)
 
-    # Initialize queue manager
-    app.queue_manager = QueueManager(redis_client)
+    # Add rate limiter middleware. With the queue's Redis the limits hold
+    # across all workers, and in-flight analyses per client are bounded.
+    if enable_rate_limiter:
+        if redis_client is not None:
+            app.add_middleware(
+                ConcurrentRequestLimiter,
+                redis_client=redis_client,
+                max_concurrent=MAX_CONCURRENT_ANALYSES
+            )
+        app.add_middleware(RateLimiter, redis_client=redis_client)
 
-    # Add Prometheus instrumentation
-    if not test_mode:
-        Instrumentator().instrument(app).expose(app)
+    # Add Prometheus instrumentation. Health probes and scrapes are the most
+    # frequent requests and their latency says nothing about the API, so
+    # they are not observed.
+    if enable_prometheus:
+        Instrumentator(
+            excluded_handlers=PROMETHEUS_EXCLUDED_HANDLERS
+        ).instrument(app).expose(app)
 
     # Include routers
     app.include_router(health, prefix="/health", tags=["health"])
 
-    SUPPORTED_INDICATORS = {'RSI', 'MACD', 'BB', 'STOCH'}
-
-    # Initialize custom metrics
-    from prometheus_client import Counter
-    analysis_counter = Counter(
-        'market_analysis_total_analyses',
-        'Total number of market analyses performed',
-        ['symbol', 'status']
-    )
+    @app.get("/health")
+    async def health_check():
+        """Health check endpoint."""
+        return {"status": "healthy"}
 
     @app.get("/", response_model=Dict[str, str])
     async def root():
@@ -103,85 +519,243 @@ def create_app(test_mode: bool = False) -> FastAPI:
             "version": "1.0.0"
         }
 
-    @app.post("/analyze", response_model=AnalysisResult)
-    async def analyze_market(request: AnalysisRequest) -> AnalysisResult:
-        """Analyze market data for a given symbol."""
-        try:
-            # Initialize market analyzer
-            analyzer = MarketAnalyzer(request.symbol, test_mode=True)
+    async def run_analysis(request: AnalysisRequest) -> AnalysisResult:
+        """Run the analysis pipeline for one symbol through the result cache."""
+        indicators_up = check_indicators(request.indicators)
 
-            # Fetch market data
-            market_data = await analyzer.fetch_data(
-                start_time=request.start_time,
-                end_time=request.end_time
-            )
+        # One clock read per request, shared by the cache key and the result
+        now = datetime.now(timezone.utc)
+        cache_key = analysis_cache_key(request, now)
+        result = analysis_cache.get(cache_key)
+        if result is not None:
+            return result
 
-            # Calculate technical indicators
-            technical_indicators = {}
-            for indicator in request.indicators:
-                if indicator == "RSI":
-                    technical_indicators["RSI"] = analyzer.calculate_rsi(market_data)
-                elif indicator == "MACD":
-                    technical_indicators["MACD"] = analyzer.calculate_macd(market_data)
-                elif indicator == "BB":
-                    technical_indicators["BB"] = analyzer.calculate_bollinger_bands(market_data)
-                elif indicator == "STOCH":
-                    technical_indicators["STOCH"] = analyzer.calculate_stochastic(market_data)
-
-            # Generate trading signals
-            try:
-                signals = analyzer.generate_trading_signals(
-                    technical_indicators=technical_indicators,
-                    thresholds=request.thresholds
-                )
-            except Exception as e:
-                logger.warning(f"Error generating trading signals: {str(e)}")
+        with translate_errors("creating analysis result", symbol=request.symbol):
+            # Get (or create) the warm market analyzer for this symbol
+            analyzer = await get_analyzer(request.symbol)
+
+            # Analyzers are shared per symbol, so requests for the same
+            # symbol run their pipeline one at a time
+            async with _get_lock(_analysis_locks, request.symbol):
+                # A request that waited on the lock may find its result ready
+                result = analysis_cache.get(cache_key)
+                if result is not None:
+                    return result
+
+                # Reuse the indicators cached for this window, if any, with the
+                # frame they were computed from and their latest values
+                bundle_key = (request.symbol, _floor_minute(request.start_time), _floor_minute(request.end_time))
+                bundle = indicator_cache.get(bundle_key)
+
+                # Calculate technical indicators and, if requested, identify
+                # market states concurrently in worker threads
+                stages = []
+                if bundle is not None:
+                    market_data, indicators, latest = bundle
+                    analyzer.reset(market_data)
+                    analyzer.technical_indicators = indicators
+                else:
+                    market_data = await get_market_data(
+                        analyzer,
+                        request.start_time,
+                        request.end_time
+                    )
+                    stages.append(asyncio.to_thread(analyzer.calculate_technical_indicators))
+                if request.state_analysis:
+                    stages.append(asyncio.to_thread(
+                        analyzer.identify_market_states,
+                        n_states=request.num_states
+                    ))
+                errors = await asyncio.gather(*stages, return_exceptions=True)
+                if bundle is None:
+                    indicator_error, *errors = errors
+                    if indicator_error is not None:
+                        raise indicator_error
+                    latest = {
+                        key: last_value(series)
+                        for key, series in analyzer.technical_indicators.items()
+                    }
+                    indicator_cache[bundle_key] = (market_data, analyzer.technical_indicators, latest)
+                state_errors = errors
+
+                # Generate trading signals. Requests with neither state analysis
+                # nor thresholds only want indicator values, so they skip signal
+                # generation and the state identification it would trigger.
                 signals = []
+                if request.state_analysis or request.thresholds is not None:
+                    try:
+                        signals_data = await asyncio.to_thread(
+                            analyzer.generate_trading_signals,
+                            thresholds=request.thresholds
+                        )
+                        signals = build_trading_signals(
+                            analyzer.data.index,
+                            signals_data,
+                            request.indicators,
+                            min_strength=(request.thresholds or DEFAULT_THRESHOLDS).min_signal_strength,
+                            limit=request.max_signals
+                        )
+                    except SIGNAL_ERRORS as e:
+                        logger.warning("Error generating trading signals: %s", e)
 
-            # Create technical indicators list
-            technical_indicators_list = [
-                TechnicalIndicator(
-                    name=name,
-                    value=float(value.iloc[-1]) if hasattr(value, 'iloc') else float(value[-1]),
-                    upper_threshold=request.thresholds.get(f"{name.lower()}_overbought") if request.thresholds else None,
-                    lower_threshold=request.thresholds.get(f"{name.lower()}_oversold") if request.thresholds else None
+                # Create technical indicators list from the latest value of each
+                # requested series, skipping indicators without a finite value
+                values = clean_array([latest[INDICATOR_SERIES[name]] for name in indicators_up])
+                finite = np.isfinite(values)
+                # Threshold pairs are resolved once per request, not per indicator
+                thresholds = request.thresholds
+                bounds = {
+                    name: (getattr(thresholds, upper_key), getattr(thresholds, lower_key))
+                    for name, (upper_key, lower_key) in INDICATOR_THRESHOLD_KEYS.items()
+                } if thresholds else {}
+                technical_indicators_list = []
+                for name, value, is_finite in zip(indicators_up, values.tolist(), finite):
+                    if not is_finite:
+                        continue
+                    upper, lower = bounds.get(name, NO_THRESHOLDS)
+                    technical_indicators_list.append(TechnicalIndicator.model_construct(
+                        name=name,
+                        value=value,
+                        upper_threshold=upper,
+                        lower_threshold=lower
+                    ))
+
+                # Describe the current market state if requested
+                market_states = []
+                if request.state_analysis:
+                    if state_errors[0] is not None:
+                        logger.warning("Error identifying market states: %s", state_errors[0])
+                    else:
+                        state_id = int(analyzer.current_state)
+                        characteristics = analyzer.state_characteristics.get(state_id, {})
+                        # Sanitize every characteristic in one array pass
+                        state_values = clean_array(list(characteristics.values()))
+                        market_states = [MarketState.model_construct(
+                            state_id=state_id,
+                            description=f"State {state_id}",
+                            characteristics={
+                                key: value
+                                for key, value, is_finite in zip(
+                                    characteristics, state_values.tolist(), np.isfinite(state_values)
+                                )
+                                if is_finite
+                            }
+                        )]
+
+                # Create analysis result. Every field was produced above from
+                # validated input, so the models are built without validation.
+                result = AnalysisResult.model_construct(
+                    symbol=request.symbol,
+                    timestamp=now,
+                    current_price=clean_float(last_value(market_data['close'])),
+                    technical_indicators=technical_indicators_list,
+                    market_states=market_states,
+                    signals=signals
                 )
-                for name, value in technical_indicators.items()
-            ]
-
-            # Perform state analysis if requested
-            market_states = []
-            if request.state_analysis:
-                try:
-                    market_states = analyzer.detect_market_states(
-                        market_data,
-                        num_states=request.num_states
-                    )
-                except Exception as e:
-                    logger.warning(f"Error detecting market states: {str(e)}")
-
-            # Create analysis result
-            result = AnalysisResult(
-                symbol=request.symbol,
-                timestamp=datetime.now(timezone.utc),
-                current_price=float(market_data['close'].iloc[-1]) if not market_data.empty else None,
-                technical_indicators=technical_indicators_list,
-                market_states=market_states,
-                signals=signals
-            )
+                analysis_cache[cache_key] = result
+                analysis_counter.labels(symbol=request.symbol, status="success").inc()
             return result
 
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e))
-        except Exception as e:
-            logger.error(f"Error creating analysis result: {str(e)}")
-            raise HTTPException(status_code=500, detail=str(e))
+    @app.post("/analyze", response_model=AnalysisResult)
+    async def analyze_market(request: AnalysisRequest, stream: Optional[bool] = None):
+        """Analyze market data for a given symbol.
+
+        With ``stream=true``, or by default once more than
+        STREAM_SIGNALS_THRESHOLD signals would be returned, the result is
+        sent as NDJSON: the result without its signals on the first line,
+        then one signal per line, newest first.
+        """
+        result = await run_analysis(request)
+        if stream is None:
+            stream = len(result.signals) > STREAM_SIGNALS_THRESHOLD
+        if not stream:
+            # The result is already an AnalysisResult, so skip FastAPI's
+            # response model pass and hand the dump straight to orjson
+            return ORJSONResponse(result.model_dump())
+
+        def generate():
+            # Dump the whole result in one serializer call rather than one
+            # per signal, then split the signals off into their own lines
+            payload = result.model_dump()
+            signals = payload.pop('signals')
+            yield orjson.dumps(payload, option=ORJSON_OPTIONS) + b"\n"
+            for signal in signals:
+                yield orjson.dumps(signal, option=ORJSON_OPTIONS) + b"\n"
+
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+    @app.post("/analyze/batch", response_model=List[AnalysisResult])
+    async def analyze_batch(request: BatchAnalysisRequest) -> ORJSONResponse:
+        """Analyze several symbols with the same settings.
+
+        Market data for every uncached symbol is fetched in one provider
+        call, then each symbol runs the regular /analyze pipeline
+        concurrently.
+        """
+        # Fail before paying for the batch download
+        check_indicators(request.indicators)
+        symbols = list(dict.fromkeys(request.symbols))
+        with translate_errors("fetching batch market data"):
+            analyzers = await asyncio.gather(*(get_analyzer(symbol) for symbol in symbols))
+            await prefetch_market_data(analyzers, request.start_time, request.end_time)
+
+        results = await asyncio.gather(
+            *(run_analysis(request.for_symbol(symbol)) for symbol in symbols)
+        )
+        return ORJSONResponse(ANALYSIS_RESULTS_ADAPTER.dump_python(results))
+
+    @app.get("/analyze/{symbol}/signals/stream")
+    async def stream_signals(
+        symbol: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        thresholds: SignalThresholds = Depends(query_thresholds)
+    ) -> StreamingResponse:
+        """Stream the full signal history for a symbol as NDJSON.
+
+        Signals are emitted oldest first, one JSON object per line, so the
+        full series is never held in memory as response models. Signal
+        thresholds are taken from the query string.
+        """
+        with translate_errors("streaming signals"):
+            analyzer = await get_analyzer(symbol)
+
+            # The analyzer is shared with /analyze, so its data is only
+            # touched under the same per-symbol lock, until the signal
+            # timestamps have been read from the frame they index
+            async with _get_lock(_analysis_locks, symbol):
+                await get_market_data(analyzer, start_time, end_time)
+                signals_data = await asyncio.to_thread(
+                    analyzer.generate_trading_signals,
+                    thresholds=thresholds
+                )
+                positions, signal_types, confidences = select_signals(
+                    signals_data, thresholds.min_signal_strength
+                )
+                timestamps = analyzer.data.index[positions].to_pydatetime()
+
+        # Convert the selected columns to Python objects in one pass each
+        signal_types, confidences = signal_types.tolist(), confidences.tolist()
+
+        def generate():
+            for timestamp, signal_type, conf in zip(timestamps, signal_types, confidences):
+                yield orjson.dumps({
+                    "timestamp": timestamp,
+                    "signal_type": signal_type,
+                    "confidence": conf
+                }, option=ORJSON_OPTIONS) + b"\n"
+
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
 
-    @app.websocket("/ws/market/{market_id}")
-    async def websocket_endpoint(websocket: WebSocket, market_id: str):
-        """WebSocket endpoint for market data subscription."""
-        await handle_market_subscription(websocket, market_id, app.queue_manager)
+    if enable_queue:
+        @app.websocket("/ws/market/{market_id}")
+        async def websocket_endpoint(websocket: WebSocket, market_id: str):
+            """WebSocket endpoint for market data subscription."""
+            await handle_market_subscription(websocket, market_id, app.queue_manager)
 
     return app
 
+# Test-mode app for importers and the test suite. Deployments build a full
+# app, rate limiters and metrics included, with uvicorn's --factory option
+# on create_app.
 app = create_app(test_mode=True)
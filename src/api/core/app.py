@@ -1,25 +1,9 @@
 """
 Core FastAPI application implementation.
-"""
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-
-app = FastAPI(
-    title="Market Analysis API",
-    description="API for market analysis and trading signals",
-    version="1.0.0"
-)
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Update this in production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+The app is built by the shared factory in src.api.app, without the Redis
+queue, rate limiter or Prometheus instrumentation.
+"""
+from src.api.app import create_app
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy"}
+app = create_app(test_mode=True, enable_queue=False)
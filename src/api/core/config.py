@@ -1,7 +1,8 @@
 """
 Configuration management for the FastAPI application.
 """
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     """Application settings."""
@@ -10,10 +11,12 @@ class Settings(BaseSettings):
     api_host: str = "0.0.0.0"
     api_port: int = 8000
 
-    class Config:
-        """Pydantic config."""
-        env_file = ".env"
+    # Frozen because one instance is shared by every caller of get_settings.
+    # The .env file also carries settings for other services, so unknown
+    # keys are ignored.
+    model_config = SettingsConfigDict(env_file=".env", frozen=True, extra="ignore")
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
+    """Get application settings, reading the environment and .env once."""
     return Settings()
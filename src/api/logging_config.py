@@ -0,0 +1,16 @@
+"""
+Logging configuration for the market analysis API.
+"""
+import logging
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_configured = False
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """Configure root logging once per process; later calls are no-ops."""
+    global _configured
+    if _configured:
+        return
+    logging.basicConfig(level=level, format=LOG_FORMAT)
+    _configured = True
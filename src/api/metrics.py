@@ -0,0 +1,13 @@
+"""
+Custom Prometheus metrics for the market analysis API.
+
+Metrics live in the process-wide registry, so they are defined here, once
+per process, rather than by each app create_app builds.
+"""
+from prometheus_client import Counter
+
+analysis_counter = Counter(
+    'market_analysis_total_analyses',
+    'Total number of market analyses performed',
+    ['symbol', 'status']
+)
@@ -1,4 +1,5 @@
 """Middleware package."""
+from .concurrent_limiter import ConcurrentRequestLimiter
 from .rate_limiter import RateLimiter
 
-__all__ = ["RateLimiter"]
+__all__ = ["ConcurrentRequestLimiter", "RateLimiter"]
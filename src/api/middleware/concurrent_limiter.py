@@ -0,0 +1,142 @@
+"""Concurrent request limiter middleware."""
+from starlette.types import ASGIApp, Receive, Scope, Send
+from typing import Tuple
+import asyncio
+import secrets
+import time
+import logging
+
+from src.api.queue.redis_client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+# Drops slots older than the TTL (left behind by crashed workers), then
+# admits the request only if the client is below its limit. Slots are
+# scored by their start time in integer milliseconds. Runs atomically on
+# the Redis server.
+ACQUIRE_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+local c = redis.call('ZCARD', KEYS[1])
+if c >= tonumber(ARGV[3]) then return 0 end
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[4])
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+return 1
+"""
+
+# Body of every 429 response
+LIMITED_BODY = b'{"error": "Too many concurrent requests"}'
+LIMITED_LENGTH = b"%d" % len(LIMITED_BODY)
+
+class ConcurrentRequestLimiter:
+    """Limit how many heavy requests each client may have in flight.
+
+    Slots are kept in a Redis sorted set per client so the limit holds
+    across workers. Unlike RateLimiter this bounds parallel work, not the
+    number of requests per minute. As plain ASGI middleware the slot is
+    held until the response body, streamed or not, has been sent. While a
+    request runs its slot is refreshed every third of the TTL, so only
+    slots of crashed workers are ever reclaimed.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        redis_client: RedisClient,
+        max_concurrent: int = 4,
+        slot_ttl: int = 60,
+        paths: Tuple[str, ...] = ("/analyze",)
+    ):
+        """Initialize concurrent request limiter.
+
+        Args:
+            app: ASGI application
+            redis_client: Redis client holding the slot sets
+            max_concurrent: Requests a client may have in flight at once
+            slot_ttl: Seconds after which a slot no longer refreshed is reclaimed
+            paths: Path prefixes the limit applies to
+        """
+        self.app = app
+        self.redis_client = redis_client
+        self.max_concurrent = max_concurrent
+        self.slot_ttl = slot_ttl
+        self.paths = paths
+        self._acquire = None
+        if not redis_client.test_mode:
+            self._acquire = redis_client.redis_client.register_script(ACQUIRE_SCRIPT)
+
+    def _try_acquire(self, key: str, request_id: str) -> bool:
+        """Claim a slot for a request; True if the client was under its limit."""
+        # Integer scores keep small sets in Redis' compact listpack encoding
+        now_ms = int(time.time() * 1000)
+        return bool(self._acquire(
+            keys=[key],
+            args=[now_ms - self.slot_ttl * 1000, now_ms, self.max_concurrent,
+                  request_id, self.slot_ttl]
+        ))
+
+    def _refresh(self, key: str, request_id: str) -> None:
+        """Move a held slot's start time to now, keeping the set alive."""
+        client = self.redis_client.redis_client
+        pipeline = client.pipeline(transaction=False)
+        pipeline.zadd(key, {request_id: int(time.time() * 1000)}, xx=True)
+        pipeline.expire(key, self.slot_ttl)
+        pipeline.execute()
+
+    async def _keep_alive(self, key: str, request_id: str) -> None:
+        """Refresh a slot until cancelled, so long requests keep holding it."""
+        while True:
+            await asyncio.sleep(self.slot_ttl / 3)
+            try:
+                await asyncio.to_thread(self._refresh, key, request_id)
+            except Exception as e:
+                logger.error("Failed to refresh concurrent request slot: %s", e)
+
+    def _release(self, key: str, request_id: str) -> None:
+        """Free the slot held by a request."""
+        self.redis_client.redis_client.zrem(key, request_id)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle request."""
+        if (
+            self._acquire is None
+            or scope["type"] != "http"
+            or not scope["path"].startswith(self.paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        client_id = scope["client"][0] if scope.get("client") else "unknown"
+        key = f"concurrent:{client_id}"
+        request_id = secrets.token_hex(8)
+
+        # Redis being unavailable must not take the API down with it
+        try:
+            acquired = await asyncio.to_thread(self._try_acquire, key, request_id)
+        except Exception as e:
+            logger.error("Concurrent limiter unavailable: %s", e)
+            await self.app(scope, receive, send)
+            return
+
+        if not acquired:
+            logger.warning("Concurrent request limit exceeded for client %s", client_id)
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", LIMITED_LENGTH),
+                    (b"retry-after", b"1")
+                ]
+            })
+            await send({"type": "http.response.body", "body": LIMITED_BODY})
+            return
+
+        keep_alive = asyncio.create_task(self._keep_alive(key, request_id))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            keep_alive.cancel()
+            try:
+                await asyncio.to_thread(self._release, key, request_id)
+            except Exception as e:
+                logger.error("Failed to release concurrent request slot: %s", e)
@@ -2,10 +2,9 @@
 Error handling middleware for API request error handling and logging.
 """
 import logging
-import traceback
 from typing import Union, Dict, Any
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from src.api.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -51,23 +50,24 @@ class ErrorHandler(BaseHTTPMiddleware):
         try:
             return await call_next(request)
         except ValidationError as e:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=422,
                 content={"error": "Validation error", "details": e.errors()}
             )
         except RequestValidationError as e:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=422,
                 content={"error": "Request validation error", "details": e.errors()}
             )
         except HTTPException as e:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=e.status_code,
                 content={"error": e.detail}
             )
         except Exception as e:
-            logger.error(f"Unhandled error: {str(e)}")
-            return JSONResponse(
+            # Tracebacks are only formatted when debugging
+            logger.error("Unhandled error: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            return ORJSONResponse(
                 status_code=500,
                 content={"error": "Internal server error"}
             )
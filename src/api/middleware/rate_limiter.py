@@ -1,66 +1,313 @@
 """Rate limiter middleware."""
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from collections import OrderedDict, deque
+from typing import Deque, List, Optional, Tuple
+import asyncio
 import time
 import logging
 
+from src.api.queue.redis_client import RedisClient
+
 logger = logging.getLogger(__name__)
 
-class RateLimiter(BaseHTTPMiddleware):
-    """Rate limiter middleware."""
+# Approximate sliding window check for one client, run atomically on the
+# Redis server. Each client has one hash (KEYS[1]) holding a counter per
+# fixed window; ARGV[2] and ARGV[3] are the current and previous window
+# fields. The previous count is weighted by how much of it still overlaps
+# the sliding window. The TTL is only set by the first request of each
+# window, which keeps the hash alive through the end of the next window.
+# Returns whether the request was admitted and the estimated count
+# including it.
+SLIDING_WINDOW_SCRIPT = """
+local window = tonumber(ARGV[1])
+local counts = redis.call('HMGET', KEYS[1], ARGV[2], ARGV[3])
+local current = tonumber(counts[1] or '0')
+local previous = tonumber(counts[2] or '0')
+local count = math.floor(previous * tonumber(ARGV[4])) + current
+if count >= tonumber(ARGV[5]) then
+    return {0, count}
+end
+if redis.call('HINCRBY', KEYS[1], ARGV[2], 1) == 1 then
+    redis.call('HDEL', KEYS[1], ARGV[6])
+    redis.call('EXPIRE', KEYS[1], 2 * window)
+end
+return {1, count + 1}
+"""
+
+# In-process windows are split over this many dicts (a power of two) by
+# client hash. Idle clients are swept one shard at a time, so no single
+# request pays for a pass over every client.
+LOCAL_WINDOW_SHARDS = 64
+
+# Most clients the in-process windows track at once. Past this the least
+# recently seen client of a shard is dropped, so a sweep over many
+# addresses can't grow memory without bound between idle sweeps.
+MAX_LOCAL_CLIENTS = 100_000
+
+# Longest wait at shutdown for queued Redis checks to be sent, in seconds
+FLUSH_TIMEOUT = 5.0
+
+# Body of every 429 response
+RATE_LIMITED_BODY = b'{"error": "Rate limit exceeded"}'
+RATE_LIMITED_LENGTH = b"%d" % len(RATE_LIMITED_BODY)
 
-    def __init__(self, app, requests_per_minute: int = 100, test_mode: bool = False):
-        """Initialize rate limiter."""
-        super().__init__(app)
+class RateLimiter:
+    """Rate limiter middleware.
+
+    Request timestamps are kept in process memory, or in Redis when a
+    client is given so the limit is shared by every worker. Implemented as
+    plain ASGI so requests are not wrapped in Request/Response objects and
+    an extra task per call.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        requests_per_minute: int = 100,
+        test_mode: bool = False,
+        redis_client: Optional[RedisClient] = None,
+        exempt_paths: Tuple[str, ...] = ("/health", "/metrics")
+    ):
+        """Initialize rate limiter.
+
+        Requests for ``exempt_paths`` or a path below one of them (health
+        probes and metric scrapes by default) are passed through without
+        counting against a client.
+        """
+        self.app = app
+        self.exempt_paths = exempt_paths
+        self._exempt_prefixes = tuple(path.rstrip("/") + "/" for path in exempt_paths)
         self.requests_per_minute = requests_per_minute
         self.window_size = 60  # seconds
-        self.requests = {}
+        # The limit header never changes, so it is encoded once
+        self._limit_header = (b"x-ratelimit-limit", b"%d" % requests_per_minute)
+        # Headers every 429 response starts with
+        self._rejected_headers = (
+            (b"content-type", b"application/json"),
+            (b"content-length", RATE_LIMITED_LENGTH),
+            self._limit_header,
+            (b"x-ratelimit-remaining", b"0")
+        )
+        # Each shard is kept in least to most recently seen order
+        self._shards: List["OrderedDict[str, Deque[float]]"] = [
+            OrderedDict() for _ in range(LOCAL_WINDOW_SHARDS)
+        ]
+        self._max_shard_clients = MAX_LOCAL_CLIENTS // LOCAL_WINDOW_SHARDS
         self.test_mode = test_mode
+        # Every shard is swept once per window, one shard per interval
+        self._sweep_interval = self.window_size / LOCAL_WINDOW_SHARDS
+        self._next_sweep_shard = 0
+        self._last_sweep = time.monotonic()
+        self._sliding_window = None
+        if redis_client is not None and not redis_client.test_mode:
+            self._redis = redis_client.redis_client
+            self._sliding_window = self._redis.register_script(SLIDING_WINDOW_SCRIPT)
+        # Redis checks waiting for the next pipeline, and the task sending them
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flusher: Optional[asyncio.Task] = None
 
     def reset(self):
         """Reset rate limiter state. Used for testing."""
-        self.requests.clear()
+        for shard in self._shards:
+            shard.clear()
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """Handle request."""
-        client_id = "test_client" if self.test_mode else request.client.host
+    def _check_local(self, client_id: str) -> Tuple[bool, int, float]:
+        """Count a request against the in-process window.
+
+        Uses the monotonic clock, which wall clock adjustments can't move.
+        Returns whether it is admitted, the requests in the window and the
+        seconds until the window frees up.
+        """
+        current_time = time.monotonic()
+        if current_time - self._last_sweep >= self._sweep_interval:
+            self._sweep(current_time)
+
+        shard = self._shards[hash(client_id) & (LOCAL_WINDOW_SHARDS - 1)]
+        timestamps = shard.get(client_id)
+        if timestamps is None:
+            timestamps = shard[client_id] = deque()
+            if len(shard) > self._max_shard_clients:
+                shard.popitem(last=False)
+        else:
+            shard.move_to_end(client_id)
+
+        # Timestamps are appended in order, so expired ones are all at the
+        # front and are popped without rebuilding the window
+        cutoff = current_time - self.window_size
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
+
+        if len(timestamps) < self.requests_per_minute:
+            timestamps.append(current_time)
+            return True, len(timestamps), self.window_size
+        return False, len(timestamps), timestamps[0] + self.window_size - current_time
+
+    def _sweep(self, current_time: float) -> None:
+        """Forget the clients of the next shard with no request in the window.
+
+        Shards are visited round robin, so memory only holds recently active
+        clients instead of every address ever seen, and each sweep touches
+        a fraction of them.
+        """
+        shard = self._shards[self._next_sweep_shard]
+        cutoff = current_time - self.window_size
+        idle = [
+            client_id for client_id, timestamps in shard.items()
+            if not timestamps or timestamps[-1] <= cutoff
+        ]
+        for client_id in idle:
+            del shard[client_id]
+        self._next_sweep_shard = (self._next_sweep_shard + 1) % LOCAL_WINDOW_SHARDS
+        self._last_sweep = current_time
+
+    def _check_redis(self, client_ids: List[str]) -> List[Tuple[bool, int, float]]:
+        """Count one request per client against the windows shared through Redis.
+
+        All checks go out in a single pipeline, so a burst of requests
+        costs one round trip. Memory per client is one small hash
+        regardless of request volume. Buckets are aligned to wall clock
+        time so every worker agrees on them; a rejected client is told to
+        wait for the next bucket.
+        """
         current_time = time.time()
+        bucket = int(current_time // self.window_size)
+        window_end = (bucket + 1) * self.window_size
+        previous_weight = (window_end - current_time) / self.window_size
+        args = [self.window_size, bucket, bucket - 1, previous_weight,
+                self.requests_per_minute, bucket - 2]
 
-        # Clean up old requests
-        if client_id in self.requests:
-            self.requests[client_id] = [
-                timestamp for timestamp in self.requests[client_id]
-                if current_time - timestamp < self.window_size
-            ]
+        pipeline = self._redis.pipeline(transaction=False)
+        for client_id in client_ids:
+            self._sliding_window(keys=[f"ratelimit:{client_id}"], args=args, client=pipeline)
+        return [
+            (True, int(count), self.window_size) if allowed
+            else (False, int(count), window_end - current_time)
+            for allowed, count in pipeline.execute()
+        ]
 
-        # Initialize request list for new clients
-        if client_id not in self.requests:
-            self.requests[client_id] = []
+    async def _check_redis_batched(self, client_id: str) -> Tuple[bool, int, float]:
+        """Queue a Redis check to go out with the next pipeline."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((client_id, future))
+        if self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._flush_pending())
+        return await future
 
-        # Check rate limit
-        if len(self.requests[client_id]) >= self.requests_per_minute:
-            logger.warning(f"Rate limit exceeded for client {client_id}")
-            response = Response(
-                content='{"error": "Rate limit exceeded"}',
-                status_code=429,
-                headers={
-                    "Content-Type": "application/json"
-                }
-            )
-            reset_time = min(self.requests[client_id]) + self.window_size
-            remaining = 0
+    async def _flush_pending(self) -> None:
+        """Send queued checks until none are left.
+
+        Requests arriving while a pipeline is in flight are collected and
+        sent together in the next one.
+        """
+        while self._pending:
+            batch, self._pending = self._pending, []
+            try:
+                results = await asyncio.to_thread(
+                    self._check_redis, [client_id for client_id, _ in batch]
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def _is_exempt(self, path: str) -> bool:
+        """Whether a path is an exempt path or below one.
+
+        Matches whole segments, so /healthz or /metrics-foo are still
+        limited, and paths with dot segments are never exempt.
+        """
+        if path in self.exempt_paths:
+            return True
+        return path.startswith(self._exempt_prefixes) and "/." not in path
+
+    async def aclose(self) -> None:
+        """Send the Redis checks still queued and stop the flusher.
+
+        Run when the app shuts down. Checks not sent within FLUSH_TIMEOUT
+        are cancelled with the flusher.
+        """
+        flusher = self._flusher
+        if flusher is None or flusher.done():
+            return
+        try:
+            await asyncio.wait_for(flusher, FLUSH_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("Dropping %d queued rate limit checks at shutdown", len(self._pending))
+        for _, future in self._pending:
+            future.cancel()
+        self._pending = []
+
+    def _close_on_shutdown(self, receive: Receive) -> Receive:
+        """Wrap a lifespan receive to close the limiter before app shutdown."""
+        async def receive_with_close() -> Message:
+            message = await receive()
+            if message["type"] == "lifespan.shutdown":
+                await self.aclose()
+            return message
+        return receive_with_close
+
+    def _headers(self, remaining: int, reset_after: int) -> List[Tuple[bytes, bytes]]:
+        """Build the rate limit headers for a response."""
+        reset = b"%d" % reset_after
+        return [
+            self._limit_header,
+            (b"x-ratelimit-remaining", b"%d" % remaining),
+            (b"x-ratelimit-reset", reset),
+            (b"retry-after", reset if remaining == 0 else b"0")
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle request."""
+        # Bypass before any per-request work
+        if scope["type"] != "http" or self._is_exempt(scope["path"]):
+            if scope["type"] == "lifespan":
+                receive = self._close_on_shutdown(receive)
+            await self.app(scope, receive, send)
+            return
+
+        if self.test_mode:
+            client_id = "test_client"
         else:
-            # Add current request
-            self.requests[client_id].append(current_time)
-            response = await call_next(request)
-            reset_time = current_time + self.window_size
-            remaining = self.requests_per_minute - len(self.requests[client_id])
-
-        # Add rate limit headers
-        response.headers["X-RateLimit-Limit"] = str(self.requests_per_minute)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Reset"] = str(int(reset_time - current_time))
-        response.headers["Retry-After"] = str(int(reset_time - current_time)) if remaining == 0 else "0"
-
-        return response
+            client_id = scope["client"][0] if scope.get("client") else "unknown"
+
+        # Each backend reads its own clock once per request
+        if self._sliding_window is not None:
+            try:
+                allowed, count, reset_after = await self._check_redis_batched(client_id)
+            except Exception as e:
+                # Fall back to this worker's own window while Redis is down
+                logger.error("Redis rate limiter unavailable: %s", e)
+                allowed, count, reset_after = self._check_local(client_id)
+        else:
+            allowed, count, reset_after = self._check_local(client_id)
+
+        # Check rate limit
+        if not allowed:
+            logger.warning("Rate limit exceeded for client %s", client_id)
+            reset = b"%d" % reset_after
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    *self._rejected_headers,
+                    (b"x-ratelimit-reset", reset),
+                    (b"retry-after", reset)
+                ]
+            })
+            await send({"type": "http.response.body", "body": RATE_LIMITED_BODY})
+            return
+
+        headers = self._headers(self.requests_per_minute - count, int(reset_after))
+
+        async def send_with_headers(message: Message) -> None:
+            # Add rate limit headers
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -8,8 +8,11 @@ from src.api.models.analysis import (
     SignalThresholds,
     TechnicalIndicator,
     MarketState,
+    SignalType,
     TradingSignal,
+    AnalysisSettings,
     AnalysisRequest,
+    BatchAnalysisRequest,
     AnalysisResult
 )
 
@@ -20,7 +23,10 @@ __all__ = [
     'SignalThresholds',
     'TechnicalIndicator',
     'MarketState',
+    'SignalType',
     'TradingSignal',
+    'AnalysisSettings',
     'AnalysisRequest',
+    'BatchAnalysisRequest',
     'AnalysisResult'
 ]
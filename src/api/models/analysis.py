@@ -1,12 +1,17 @@
 from datetime import datetime, timedelta
+from enum import Enum
 from typing import List, Dict, Optional, Union, Literal, Any
-from pydantic import BaseModel, Field, field_validator, model_validator
-from decimal import Decimal
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 import math
 from datetime import timezone
 
+# Indicators analyzed when a request names none
+DEFAULT_INDICATORS = ('RSI', 'MACD', 'BB')
+
 class TimeWindowConfig(BaseModel):
     """Configuration for time windows of different indicators"""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     rsi_window: int = Field(default=14, ge=1, description="RSI calculation window")
     macd_fast_period: int = Field(default=12, ge=1, description="MACD fast period")
     macd_slow_period: int = Field(default=26, ge=1, description="MACD slow period")
@@ -25,6 +30,8 @@ class TimeWindowConfig(BaseModel):
 
 class StateAnalysisConfig(BaseModel):
     """Configuration for market state analysis"""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     volatility_weight: float = Field(default=1.0, ge=0.0, description="Weight of volatility in state analysis")
     trend_weight: float = Field(default=1.0, ge=0.0, description="Weight of trend strength in state analysis")
     volume_weight: float = Field(default=1.0, ge=0.0, description="Weight of volume in state analysis")
@@ -41,23 +48,20 @@ class StateAnalysisConfig(BaseModel):
 
 class SignalGenerationConfig(BaseModel):
     """Configuration for signal generation process"""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     historical_window: int = Field(default=100, ge=1, description="Historical window for calculations")
     volume_impact: float = Field(default=0.2, ge=0.0, le=1.0, description="Volume impact on signal confidence")
     smoothing_window: int = Field(default=1, ge=1, description="Window for signal smoothing")
-    combination_method: str = Field(
+    combination_method: Literal['weighted', 'voting', 'consensus'] = Field(
         default="weighted",
         description="Method to combine signals: weighted, voting, or consensus"
     )
 
-    @field_validator('combination_method')
-    def validate_method(cls, v):
-        allowed_methods = {'weighted', 'voting', 'consensus'}
-        if v not in allowed_methods:
-            raise ValueError(f"Combination method must be one of {allowed_methods}")
-        return v
-
 class SignalThresholds(BaseModel):
     """Model for configurable signal thresholds"""
+    model_config = ConfigDict(frozen=True)
+
     # RSI thresholds (0-100 range)
     rsi_overbought: float = Field(default=70.0, ge=0.0, le=100.0)
     rsi_oversold: float = Field(default=30.0, ge=0.0, le=100.0)
@@ -95,6 +99,8 @@ class SignalThresholds(BaseModel):
 
 class TechnicalIndicator(BaseModel):
     """Model for technical indicator values"""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     name: str = Field(..., min_length=1, description="Name of the technical indicator")
     value: float = Field(..., description="Current value of the indicator")
     upper_threshold: Optional[float] = Field(None, description="Upper threshold for signal generation")
@@ -110,35 +116,48 @@ class TechnicalIndicator(BaseModel):
 
 class MarketState(BaseModel):
     """Market state representation."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     state_id: int
     description: str
     characteristics: Dict[str, float] = Field(default_factory=dict)
     confidence: float = Field(default=0.0, ge=0.0, le=1.0)
 
+class SignalType(str, Enum):
+    """Trading signal direction.
+
+    Lookups are case-insensitive through ``_missing_``, which pydantic-core
+    calls only for values that aren't already an exact match.
+    """
+    BUY = 'BUY'
+    SELL = 'SELL'
+    HOLD = 'HOLD'
+
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
+
 class TradingSignal(BaseModel):
     """Model for trading signals"""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     timestamp: datetime = Field(..., description="Timestamp of the signal")
-    signal_type: str = Field(..., description="Type of signal (BUY/SELL/HOLD)")
+    signal_type: SignalType = Field(..., description="Type of signal (BUY/SELL/HOLD)")
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence level of the signal")
     indicators: List[str] = Field(..., min_items=1, description="Indicators contributing to the signal")
     state_context: Optional[MarketState] = Field(None, description="Market state context for the signal")
 
-    @field_validator('signal_type')
-    def validate_signal_type(cls, v):
-        allowed_types = {'BUY', 'SELL', 'HOLD'}
-        if v.upper() not in allowed_types:
-            raise ValueError(f"Signal type must be one of {allowed_types}")
-        return v.upper()
-
-class AnalysisRequest(BaseModel):
-    """Model for market analysis request."""
-    symbol: str
-    indicators: List[str] = Field(default=["RSI", "MACD", "BB"])
+class AnalysisSettings(BaseModel):
+    """Analysis settings shared by single-symbol and batch requests."""
+    indicators: List[str] = Field(default_factory=lambda: list(DEFAULT_INDICATORS))
     state_analysis: bool = True
     num_states: int = Field(default=3, ge=2, le=5)
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
     thresholds: Optional[SignalThresholds] = None
+    max_signals: int = Field(default=500, ge=1, description="Maximum number of most recent signals to return per symbol")
 
     @model_validator(mode='after')
     def validate_dates(cls, values):
@@ -148,24 +167,48 @@ class AnalysisRequest(BaseModel):
                 raise ValueError("End time must be after or equal to start time")
         return values
 
+class AnalysisRequest(AnalysisSettings):
+    """Model for market analysis request."""
+    symbol: str
+
+class BatchAnalysisRequest(AnalysisSettings):
+    """Model for analyzing several symbols with the same settings."""
+    symbols: List[str] = Field(..., min_length=1, max_length=20)
+
+    def for_symbol(self, symbol: str) -> AnalysisRequest:
+        """Build the single-symbol request for one of the batch symbols.
+
+        The batch was validated already, so its settings, thresholds
+        included, are shared with the request instead of being dumped and
+        revalidated.
+        """
+        settings = {name: getattr(self, name) for name in AnalysisSettings.model_fields}
+        return AnalysisRequest.model_construct(symbol=symbol, **settings)
+
 class AnalysisResult(BaseModel):
     """Model for market analysis result."""
     symbol: str
-    timestamp: datetime
-    current_price: Optional[Decimal] = None
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    current_price: Optional[float] = Field(None, ge=0.0)
     technical_indicators: List[TechnicalIndicator] = Field(default_factory=list)
     market_states: List[MarketState] = Field(default_factory=list)
     signals: List[TradingSignal] = Field(default_factory=list)
 
-    def __init__(self, **data):
-        """Initialize AnalysisResult."""
-        if "market_state" in data:
-            data["market_states"] = [data.pop("market_state")]
-        if "latest_signal" in data:
-            data["signals"] = [data.pop("latest_signal")]
-            if "historical_signals" in data:
-                data["signals"].extend(data.pop("historical_signals"))
-        super().__init__(**data)
+    @model_validator(mode='before')
+    @classmethod
+    def accept_single_fields(cls, data):
+        """Map market_state, latest_signal and historical_signals onto the lists.
+
+        Runs as part of validation rather than in __init__, so model_validate
+        accepts them too and model_construct skips the check entirely.
+        """
+        if isinstance(data, dict) and ("market_state" in data or "latest_signal" in data):
+            data = dict(data)
+            if "market_state" in data:
+                data["market_states"] = [data.pop("market_state")]
+            if "latest_signal" in data:
+                data["signals"] = [data.pop("latest_signal"), *data.pop("historical_signals", ())]
+        return data
 
     @property
     def market_state(self) -> Optional[MarketState]:
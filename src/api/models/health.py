@@ -1,7 +1,7 @@
 """Health check models."""
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Dict, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 class DependencyStatus(BaseModel):
     """Status of a dependency service."""
@@ -23,7 +23,7 @@ class HealthResponse(BaseModel):
     status: str
     version: str
     environment: str
-    timestamp: datetime
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     git_commit: Optional[str] = None
     dependencies: Dict[str, DependencyStatus]
     metrics: SystemMetrics
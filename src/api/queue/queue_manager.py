@@ -61,7 +61,7 @@ class QueueManager:
             # In test mode, validate market_id format
             valid_markets = {'BTC-USD', 'ETH-USD', 'AAPL', 'GOOGL', 'MSFT'}
             if market_id not in valid_markets:
-                logger.warning(f"Test mode: Invalid market ID {market_id}")
+                logger.warning("Test mode: Invalid market ID %s", market_id)
                 return False
             return True
             
@@ -2,7 +2,7 @@
 RabbitMQ client for reliable message queuing.
 """
 import aio_pika
-import json
+import orjson
 import logging
 from typing import Any, Callable, Optional
 import asyncio
@@ -35,7 +35,7 @@ class RabbitMQClient:
                 self.channel = await self.connection.channel()
                 logger.info("Connected to RabbitMQ")
         except Exception as e:
-            logger.error(f"Error connecting to RabbitMQ: {e}")
+            logger.error("Error connecting to RabbitMQ: %s", e)
             raise
             
     async def health_check(self) -> bool:
@@ -49,7 +49,7 @@ class RabbitMQClient:
                 await self.connect()
             return not self.connection.is_closed
         except Exception as e:
-            logger.error(f"RabbitMQ health check failed: {e}")
+            logger.error("RabbitMQ health check failed: %s", e)
             return False
             
     async def declare_queue(self, queue_name: str):
@@ -61,7 +61,7 @@ class RabbitMQClient:
         try:
             await self.channel.declare_queue(queue_name, durable=True)
         except Exception as e:
-            logger.error(f"Error declaring queue: {e}")
+            logger.error("Error declaring queue: %s", e)
             raise
             
     async def publish(self, queue_name: str, message: Any):
@@ -75,16 +75,16 @@ class RabbitMQClient:
             if not self.channel:
                 await self.connect()
                 
-            serialized_message = json.dumps(message)
+            serialized_message = orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
             await self.channel.default_exchange.publish(
                 aio_pika.Message(
-                    body=serialized_message.encode(),
+                    body=serialized_message,
                     delivery_mode=aio_pika.DeliveryMode.PERSISTENT
                 ),
                 routing_key=queue_name
             )
         except Exception as e:
-            logger.error(f"Error publishing message: {e}")
+            logger.error("Error publishing message: %s", e)
             raise
             
     async def consume(self, queue_name: str, callback: Callable):
@@ -103,20 +103,20 @@ class RabbitMQClient:
             async def process_message(message: aio_pika.IncomingMessage):
                 async with message.process():
                     try:
-                        decoded_message = json.loads(message.body.decode())
+                        decoded_message = orjson.loads(message.body)
                         await callback(decoded_message)
                     except Exception as e:
-                        logger.error(f"Error processing message: {e}")
+                        logger.error("Error processing message: %s", e)
                         
             await queue.consume(process_message)
             
             try:
                 await asyncio.Future()  # run forever
             except Exception as e:
-                logger.error(f"Consumer interrupted: {e}")
+                logger.error("Consumer interrupted: %s", e)
                 
         except Exception as e:
-            logger.error(f"Error setting up consumer: {e}")
+            logger.error("Error setting up consumer: %s", e)
             raise
             
     async def close(self):
@@ -126,5 +126,5 @@ class RabbitMQClient:
                 await self.connection.close()
                 logger.info("Closed RabbitMQ connection")
         except Exception as e:
-            logger.error(f"Error closing RabbitMQ connection: {e}")
+            logger.error("Error closing RabbitMQ connection: %s", e)
             raise
@@ -2,7 +2,7 @@
 Redis client for caching and pub/sub messaging.
 """
 import redis
-import json
+import orjson
 import logging
 from typing import Any, Optional
 from datetime import timedelta
@@ -44,7 +44,7 @@ class RedisClient:
         try:
             return self.redis_client.ping()
         except redis.ConnectionError as e:
-            logger.error(f"Redis connection error: {e}")
+            logger.error("Redis connection error: %s", e)
             return False
             
     def set_data(self, key: str, value: Any, expiry: Optional[timedelta] = None) -> bool:
@@ -62,10 +62,10 @@ class RedisClient:
             return True
             
         try:
-            serialized_value = json.dumps(value)
+            serialized_value = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
             return self.redis_client.set(key, serialized_value, ex=expiry)
         except Exception as e:
-            logger.error(f"Error setting data in Redis: {e}")
+            logger.error("Error setting data in Redis: %s", e)
             return False
             
     def get_data(self, key: str) -> Optional[Any]:
@@ -82,9 +82,9 @@ class RedisClient:
             
         try:
             data = self.redis_client.get(key)
-            return json.loads(data) if data else None
+            return orjson.loads(data) if data else None
         except Exception as e:
-            logger.error(f"Error getting data from Redis: {e}")
+            logger.error("Error getting data from Redis: %s", e)
             return None
             
     def publish(self, channel: str, message: Any) -> bool:
@@ -101,10 +101,10 @@ class RedisClient:
             return True
             
         try:
-            serialized_message = json.dumps(message)
+            serialized_message = orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
             return bool(self.redis_client.publish(channel, serialized_message))
         except Exception as e:
-            logger.error(f"Error publishing message to Redis: {e}")
+            logger.error("Error publishing message to Redis: %s", e)
             return False
             
     def subscribe(self, channel: str):
@@ -124,7 +124,7 @@ class RedisClient:
             pubsub.subscribe(channel)
             return pubsub
         except Exception as e:
-            logger.error(f"Error subscribing to Redis channel: {e}")
+            logger.error("Error subscribing to Redis channel: %s", e)
             raise
 
     async def publish_market_update(self, market_id: str, data: dict) -> None:
@@ -140,9 +140,9 @@ class RedisClient:
             
         try:
             channel = f"market:{market_id}"
-            await self.redis_client.publish(channel, json.dumps(data))
+            await self.redis_client.publish(channel, orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
         except Exception as e:
-            logger.error(f"Failed to publish market update: {str(e)}")
+            logger.error("Failed to publish market update: %s", e)
             raise
 
     async def subscribe_to_market(self, market_id: str):
@@ -164,7 +164,7 @@ class RedisClient:
             await pubsub.subscribe(channel)
             return pubsub
         except Exception as e:
-            logger.error(f"Failed to subscribe to market: {str(e)}")
+            logger.error("Failed to subscribe to market: %s", e)
             raise
 
     async def unsubscribe_from_market(self, market_id: str):
@@ -181,5 +181,5 @@ class RedisClient:
             channel = f"market:{market_id}"
             await self.redis_client.pubsub().unsubscribe(channel)
         except Exception as e:
-            logger.error(f"Failed to unsubscribe from market: {str(e)}")
+            logger.error("Failed to unsubscribe from market: %s", e)
             raise
@@ -0,0 +1,25 @@
+"""
+Response classes for the market analysis API.
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+# Options for every JSON payload the API writes. UTC datetimes end in "Z",
+# the form pydantic and the API reference use.
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    orjson encodes datetimes, NumPy scalars and arrays natively and writes
+    NaN/Inf as null, so analysis payloads need no per-value pre-cleaning.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes."""
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
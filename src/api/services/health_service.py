@@ -102,7 +102,6 @@ class HealthService:
             status=status,
             version=version,
             environment=os.getenv("ENVIRONMENT", "development"),
-            timestamp=datetime.now(timezone.utc),
             git_commit=self.get_git_commit(),
             dependencies=dependencies,
             metrics=self.get_system_metrics()
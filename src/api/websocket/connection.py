@@ -29,7 +29,7 @@ class ConnectionManager:
         if market_id not in self.active_connections:
             self.active_connections[market_id] = set()
         self.active_connections[market_id].add(websocket)
-        self.logger.info(f"Client {client_id} connected to market {market_id}")
+        self.logger.info("Client %s connected to market %s", client_id, market_id)
     
     async def disconnect(self, websocket: WebSocket, market_id: str):
         """
@@ -61,7 +61,7 @@ class ConnectionManager:
                 if connection.client_state == WebSocketState.CONNECTED:
                     await connection.send_json(message)
             except Exception as e:
-                self.logger.error(f"Error broadcasting to client: {str(e)}")
+                self.logger.error("Error broadcasting to client: %s", e)
                 disconnected.add(connection)
         
         # Clean up disconnected clients
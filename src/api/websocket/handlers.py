@@ -85,10 +85,10 @@ async def handle_market_subscription(
                         "data": f"Received: {message}"
                     })
             except WebSocketDisconnect:
-                logger.info(f"Client {client_id} disconnected from {market_id}")
+                logger.info("Client %s disconnected from %s", client_id, market_id)
                 break
             except Exception as e:
-                logger.error(f"Error in WebSocket connection: {str(e)}")
+                logger.error("Error in WebSocket connection: %s", e)
                 await websocket.close(code=1011)
                 break
 
@@ -98,9 +98,9 @@ async def handle_market_subscription(
             await websocket.close(code=4004, reason=str(e.detail))
         raise e
     except WebSocketDisconnect:
-        logger.info(f"Client {client_id} disconnected from {market_id}")
+        logger.info("Client %s disconnected from %s", client_id, market_id)
     except Exception as e:
-        logger.error(f"Unexpected error in market subscription: {str(e)}")
+        logger.error("Unexpected error in market subscription: %s", e)
         try:
             if not websocket.client_state == WebSocketState.DISCONNECTED:
                 await websocket.close(code=1011)
@@ -11,6 +11,8 @@ def get_base_config():
         'rsi': {
             'window': 14,
             'threshold_percentile': 90,  # Used to dynamically set overbought/oversold
+            'oversold': 30,  # Levels used when a request gives no thresholds
+            'overbought': 70,
             'weight': 1.0
         },
         'macd': {
@@ -24,6 +26,8 @@ def get_base_config():
             'k_period': 14,
             'd_period': 3,
             'threshold_percentile': 90,  # Used to dynamically set overbought/oversold
+            'oversold': 20,  # Levels used when a request gives no thresholds
+            'overbought': 80,
             'weight': 1.0
         },
         'bollinger': {
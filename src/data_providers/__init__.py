@@ -2,13 +2,25 @@
 Market data providers package.
 """
 from .base_provider import MarketDataProvider
-from .yfinance_provider import YFinanceProvider
-from .interactive_brokers_provider import InteractiveBrokersProvider
-from .binance_provider import BinanceProvider
+import importlib
 import os
 
 import json
 
+# Provider classes are imported on first access so that a missing optional
+# client library (ib_insync, python-binance) only affects its own provider
+_PROVIDER_MODULES = {
+    'YFinanceProvider': '.yfinance_provider',
+    'InteractiveBrokersProvider': '.interactive_brokers_provider',
+    'BinanceProvider': '.binance_provider',
+}
+
+def __getattr__(name: str):
+    if name in _PROVIDER_MODULES:
+        module = importlib.import_module(_PROVIDER_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def provider_factory(provider: str = None, config: dict = None) -> MarketDataProvider:
     """
     Factory function to return a MarketDataProvider instance based on provider name or env.
@@ -33,10 +45,13 @@ def provider_factory(provider: str = None, config: dict = None) -> MarketDataPro
         except Exception as e:
             pass  # Fallback to default config
     if provider in ("yfinance", "yf"):
+        from .yfinance_provider import YFinanceProvider
         return YFinanceProvider(config)
     elif provider in ("ibkr", "interactivebrokers"):
+        from .interactive_brokers_provider import InteractiveBrokersProvider
         return InteractiveBrokersProvider(config)
     elif provider == "binance":
+        from .binance_provider import BinanceProvider
         return BinanceProvider(config)
     else:
         raise ValueError(f"Unknown provider: {provider}")
@@ -4,7 +4,8 @@ Base class for market data providers.
 from abc import ABC, abstractmethod
 from datetime import datetime
 import pandas as pd
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+import asyncio
 
 
 class MarketDataProvider(ABC):
@@ -37,6 +38,27 @@ class MarketDataProvider(ABC):
         """
         pass
 
+    async def fetch_data_batch(
+        self, symbols: List[str], start_date: datetime, end_date: datetime
+    ) -> Dict[str, pd.DataFrame]:
+        """Fetch market data for several symbols over the same window.
+
+        The default implementation runs fetch_data for every symbol
+        concurrently; providers with a multi-symbol endpoint override it.
+
+        Args:
+            symbols: Market symbols
+            start_date: Start date
+            end_date: End date
+
+        Returns:
+            Dict mapping each symbol to a DataFrame in fetch_data's format
+        """
+        frames = await asyncio.gather(
+            *(self.fetch_data(symbol, start_date, end_date) for symbol in symbols)
+        )
+        return dict(zip(symbols, frames))
+
     @abstractmethod
     async def get_real_time_data(self, symbol: str) -> pd.DataFrame:
         """Get real-time market data for a symbol.
@@ -60,3 +82,7 @@ class MarketDataProvider(ABC):
             True if symbol is valid, False otherwise
         """
         pass
+
+    async def close(self) -> None:
+        """Release any connections held by the provider."""
+        pass
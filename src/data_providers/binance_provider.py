@@ -139,6 +139,9 @@ class BinanceProvider(MarketDataProvider):
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        # Close any open connections
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the client's HTTP session."""
         if hasattr(self.client, 'close_connection'):
             self.client.close_connection()
@@ -148,5 +148,9 @@ class InteractiveBrokersProvider(MarketDataProvider):
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Disconnect from TWS/IB Gateway."""
         if self.connection:
             self.connection.disconnect()
@@ -1,16 +1,23 @@
 """
 YFinance market data provider implementation.
 """
+import asyncio
 import yfinance as yf
 import pandas as pd
 from datetime import datetime
 from ratelimit import limits, sleep_and_retry
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 from .base_provider import MarketDataProvider
 from ..config.rate_limits import get_rate_limit_config
 
 
+def _to_utc(data: pd.DataFrame) -> pd.DataFrame:
+    """Index market data in UTC so single and batch fetches agree."""
+    data.index = data.index.tz_convert('UTC')
+    return data
+
+
 class YFinanceProvider(MarketDataProvider):
     """YFinance implementation of MarketDataProvider."""
 
@@ -25,7 +32,6 @@ class YFinanceProvider(MarketDataProvider):
 
     async def fetch_data(self, symbol: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
         """Fetch historical market data using YFinance with manual rate limiting and retries."""
-        import asyncio
         calls_per_hour = self.rate_limit_config['CALLS_PER_HOUR']
         period = self.rate_limit_config['PERIOD']
         max_retries = self.rate_limit_config['MAX_RETRIES']
@@ -33,19 +39,65 @@ class YFinanceProvider(MarketDataProvider):
         
         for attempt in range(max_retries):
             try:
+                # yfinance does blocking HTTP, so keep it off the event loop
                 ticker = yf.Ticker(symbol)
-                data = ticker.history(start=start_date, end=end_date)
+                data = await asyncio.to_thread(ticker.history, start=start_date, end=end_date)
                 if data.empty:
                     raise ValueError(f"No data available for {symbol} in the specified time range")
                 # Standardize column names to lowercase
                 data.columns = [col.lower() for col in data.columns]
-                return data
+                return _to_utc(data)
             except Exception as e:
                 if attempt == max_retries - 1:
                     raise e
                 wait_time = (2 ** attempt) * base_delay
                 await asyncio.sleep(wait_time)
 
+    async def fetch_data_batch(
+        self, symbols: List[str], start_date: datetime, end_date: datetime
+    ) -> Dict[str, pd.DataFrame]:
+        """Fetch historical market data for several symbols in one download.
+
+        Args:
+            symbols: Market symbols
+            start_date: Start date
+            end_date: End date
+
+        Returns:
+            Dict mapping each symbol to a DataFrame with lowercase columns
+
+        Raises:
+            ValueError: If no data is available for one of the symbols
+        """
+        # Match Ticker.history, which falls back to one month without a start
+        # and keeps the index tz-aware even for daily bars
+        window = {'start': start_date, 'end': end_date} if start_date else {'period': '1mo', 'end': end_date}
+        data = await asyncio.to_thread(
+            yf.download,
+            symbols,
+            group_by='ticker',
+            threads=True,
+            auto_adjust=True,
+            progress=False,
+            ignore_tz=False,
+            **window
+        )
+        # Older yfinance releases return flat columns for a single ticker
+        if not isinstance(data.columns, pd.MultiIndex):
+            data = pd.concat({symbols[0]: data}, axis=1)
+
+        frames = {}
+        for symbol in symbols:
+            if symbol not in data.columns.get_level_values(0):
+                raise ValueError(f"No data available for {symbol} in the specified time range")
+            frame = data[symbol].dropna(how='all').copy()
+            if frame.empty:
+                raise ValueError(f"No data available for {symbol} in the specified time range")
+            # Standardize column names to lowercase
+            frame.columns = [col.lower() for col in frame.columns]
+            frames[symbol] = _to_utc(frame)
+        return frames
+
     async def get_real_time_data(self, symbol: str) -> pd.DataFrame:
         """Get real-time market data using YFinance.
         Note: YFinance doesn't provide true real-time data, this is delayed.
@@ -57,7 +109,7 @@ class YFinanceProvider(MarketDataProvider):
             DataFrame with latest market data
         """
         ticker = yf.Ticker(symbol)
-        data = ticker.history(period='1d', interval='1m')
+        data = await asyncio.to_thread(ticker.history, period='1d', interval='1m')
         if data.empty:
             raise ValueError(f"No real-time data available for {symbol}")
         
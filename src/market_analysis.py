@@ -16,6 +16,8 @@ import logging
 import asyncio
 import matplotlib.pyplot as plt
 from sklearn.preprocessing import StandardScaler
+from sklearn.decomposition import PCA
+from sklearn.cluster import KMeans
 from typing import List, Dict, Tuple, Optional
 from sklearn.ensemble import RandomForestRegressor, IsolationForest
 from sklearn.metrics import mean_squared_error
@@ -36,16 +38,15 @@ from src.config.technical_indicators import get_indicator_config
 
 warnings.filterwarnings('ignore')
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 # Get rate limit configuration for YFinance
 yf_config = get_rate_limit_config('yfinance')
 
+# How far past the last fitted bar a window may extend before the state
+# model (scaler, PCA and k-means) is refit instead of reused
+STATE_MODEL_MAX_AGE = timedelta(minutes=int(os.getenv("STATE_MODEL_MAX_AGE_MINUTES", 5)))
+
 @sleep_and_retry
 @limits(calls=yf_config['CALLS_PER_HOUR'], period=yf_config['PERIOD'])
 def rate_limited_fetch(symbol: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
@@ -64,7 +65,7 @@ def rate_limited_fetch(symbol: str, start_date: datetime, end_date: datetime) ->
             if attempt == yf_config['MAX_RETRIES'] - 1:
                 raise e
             wait_time = (2 ** attempt) * yf_config['BASE_WAIT_TIME']
-            logger.warning(f"Attempt {attempt + 1} failed, waiting {wait_time}s before retry")
+            logger.warning("Attempt %s failed, waiting %ss before retry", attempt + 1, wait_time)
             time.sleep(wait_time)
 
 def fetch_market_data(symbol: str, start_date: datetime, end_date: datetime, test_mode: bool = False) -> pd.DataFrame:
@@ -112,12 +113,29 @@ class MarketAnalyzer:
         self.state_description = None
         self.state_characteristics = None
         self.test_mode = test_mode
+        # Fitted state model, kept across reset() so polling requests for
+        # a slowly extending window only re-predict states
+        self._state_model = None
         if provider is None:
             from src.data_providers import provider_factory
             self.provider = provider_factory()
         else:
             self.provider = provider
 
+    def reset(self, data: pd.DataFrame) -> None:
+        """Bind new market data, dropping results derived from the old data.
+
+        Lets a long-lived analyzer be reused across requests; the same
+        frame is left bound with its indicators and states intact.
+        """
+        if data is self.data:
+            return
+        self.data = data
+        self.states = []
+        self.technical_indicators = {}
+        self.current_state = None
+        self.state_description = None
+        self.state_characteristics = None
         
     def get_state_adjusted_config(self):
         """
@@ -126,7 +144,12 @@ class MarketAnalyzer:
         if self.current_state is None or not hasattr(self, 'current_characteristics'):
             return self.indicator_config['base_config']
         
-        base_config = self.indicator_config['base_config'].copy()
+        # Copy each indicator's settings too, so the scaling below never
+        # compounds into the base config across calls on a reused analyzer
+        base_config = {
+            indicator: dict(settings)
+            for indicator, settings in self.indicator_config['base_config'].items()
+        }
         adjustment_factors = self.indicator_config['adjustment_factors']
         
         # Apply dynamic adjustments based on state characteristics
@@ -180,46 +203,64 @@ class MarketAnalyzer:
             'return_dispersion': return_dispersion
         }).fillna(0)
         
-        # Standardize features
-        scaler = StandardScaler()
-        features_scaled = scaler.fit_transform(features)
-        
-        # Perform PCA
-        from sklearn.decomposition import PCA
-        self.pca = PCA(n_components=2)
-        self.pca_result = self.pca.fit_transform(features_scaled)
-        
-        # Ensure we have enough unique points for the requested number of clusters
-        unique_points = np.unique(self.pca_result, axis=0)
-        actual_n_states = min(n_states, len(unique_points))
-        
-        # Cluster states using PCA components
-        from sklearn.cluster import KMeans
-        kmeans = KMeans(n_clusters=actual_n_states, random_state=42)
-        self.states = kmeans.fit_predict(self.pca_result)
-        
-        # Calculate state characteristics for dynamic threshold adjustment
-        self.state_characteristics = {}
-        for state in range(actual_n_states):
-            state_mask = self.states == state
-            if not np.any(state_mask):  # Skip if no points in this state
-                continue
-                
-            state_features = features[state_mask]
-            
-            # Calculate means with proper error handling
-            def safe_mean(arr):
-                return np.nan if len(arr) == 0 else np.mean(arr)
-            
-            self.state_characteristics[state] = {
-                'volatility': safe_mean(state_features['volatility']),
-                'trend_strength': safe_mean(state_features['trend_strength']),
-                'volume': safe_mean(state_features['volume']),
-                'return_dispersion': safe_mean(state_features['return_dispersion']),
-                'component_1': safe_mean(self.pca_result[state_mask, 0]),
-                'component_2': safe_mean(self.pca_result[state_mask, 1])
+        # Reuse the fitted model only while the window starts at the same bar
+        # and extends the fitted one by a short stretch of appended bars, and
+        # the requested number of states is unchanged. Any other window, such
+        # as a shorter one ending at the same bar, gets a fresh fit.
+        first_bar, last_bar = self.data.index[0], self.data.index[-1]
+        model = self._state_model
+        if (
+            model is not None
+            and model['n_states'] == n_states
+            and first_bar == model['fitted_from']
+            and timedelta(0) <= last_bar - model['fitted_through'] <= STATE_MODEL_MAX_AGE
+        ):
+            self.pca = model['pca']
+            self.pca_result = self.pca.transform(model['scaler'].transform(features))
+            kmeans = model['kmeans']
+            actual_n_states = kmeans.n_clusters
+            self.states = kmeans.predict(self.pca_result)
+        else:
+            # Standardize features
+            scaler = StandardScaler()
+            features_scaled = scaler.fit_transform(features)
+
+            # Perform PCA
+            self.pca = PCA(n_components=2)
+            self.pca_result = self.pca.fit_transform(features_scaled)
+
+            # Ensure we have enough unique points for the requested number of clusters
+            unique_points = np.unique(self.pca_result, axis=0)
+            actual_n_states = min(n_states, len(unique_points))
+
+            # Cluster states using PCA components
+            kmeans = KMeans(n_clusters=actual_n_states, random_state=42)
+            self.states = kmeans.fit_predict(self.pca_result)
+            self._state_model = {
+                'n_states': n_states,
+                'fitted_from': first_bar,
+                'fitted_through': last_bar,
+                'scaler': scaler,
+                'pca': self.pca,
+                'kmeans': kmeans
             }
         
+        # Calculate state characteristics for dynamic threshold adjustment.
+        # Every per-state mean comes from one (n_states, 6) array of column
+        # sums, and dicts are only built for states with points.
+        columns = np.column_stack([
+            features[self.feature_names].to_numpy(dtype=np.float64),
+            self.pca_result[:, :2]
+        ])
+        counts = np.bincount(self.states, minlength=actual_n_states)
+        sums = np.zeros((len(counts), columns.shape[1]))
+        np.add.at(sums, self.states, columns)
+        names = self.feature_names + ['component_1', 'component_2']
+        self.state_characteristics = {
+            state: dict(zip(names, (sums[state] / counts[state]).tolist()))
+            for state in np.flatnonzero(counts).tolist()
+        }
+        
         # Set current state and its characteristics
         self.current_state = self.states[-1]
         self.current_characteristics = self.state_characteristics[self.current_state]
@@ -282,84 +323,78 @@ class MarketAnalyzer:
             
         if self.current_state is None:
             self.identify_market_states()
-            
-        config = self.get_state_adjusted_config()
-        
-        # Override config with provided thresholds if any
+
+        # Snapshot every level once. Request thresholds are kept out of the
+        # config, which later requests on a pooled analyzer share. The state
+        # adjusted config is only built when the request gives no thresholds.
         if thresholds:
-            config['rsi']['oversold'] = thresholds.rsi_oversold
-            config['rsi']['overbought'] = thresholds.rsi_overbought
-            config['rsi']['weight'] = thresholds.rsi_weight
-            
-            config['macd']['threshold_std'] = thresholds.macd_threshold_std
-            config['macd']['weight'] = thresholds.macd_weight
-            
-            config['stochastic']['oversold'] = thresholds.stoch_oversold
-            config['stochastic']['overbought'] = thresholds.stoch_overbought
-            config['stochastic']['weight'] = thresholds.stoch_weight
-            
-            self.indicator_config['min_signal_confidence'] = thresholds.min_confidence
-        
-        # Initialize signal arrays
+            rsi_oversold, rsi_overbought = thresholds.rsi_oversold, thresholds.rsi_overbought
+            stoch_oversold, stoch_overbought = thresholds.stoch_oversold, thresholds.stoch_overbought
+            macd_threshold_std = thresholds.macd_threshold_std
+            weights = [thresholds.rsi_weight, thresholds.macd_weight, thresholds.stoch_weight]
+            min_confidence = thresholds.min_confidence
+        else:
+            config = self.get_state_adjusted_config()
+            rsi_oversold, rsi_overbought = config['rsi']['oversold'], config['rsi']['overbought']
+            stoch_oversold = config['stochastic']['oversold']
+            stoch_overbought = config['stochastic']['overbought']
+            macd_threshold_std = config['macd']['threshold_std']
+            weights = [config['rsi']['weight'], config['macd']['weight'], config['stochastic']['weight']]
+            min_confidence = self.indicator_config['min_signal_confidence']
+
+        # Look back period for the MACD threshold and volume baseline.
+        # Bars without a full look back window keep a zero signal, so the
+        # signal math below only runs over the warm bars.
+        historical_window = 100
         length = len(self.data)
+        warm = slice(historical_window, None)
         composite_signals = np.zeros(length)
         confidence_values = np.zeros(length)
-        
-        # Get historical data for percentile calculations
-        historical_window = 100  # Look back period for percentile calculations
-        
-        for i in range(historical_window, length):
-            # Calculate RSI signals
-            rsi = self.technical_indicators['rsi'].iloc[i]
-            rsi_history = self.technical_indicators['rsi'].iloc[i-historical_window:i]
-            
-            oversold = config['rsi']['oversold']
-            overbought = config['rsi']['overbought']
-            
-            rsi_signal = 1 if rsi < oversold else -1 if rsi > overbought else 0
-            rsi_strength = abs((rsi - 50) / 50)
-            
-            # Calculate MACD signals
-            macd = self.technical_indicators['macd'].iloc[i]
-            macd_signal = self.technical_indicators['macd_signal'].iloc[i]
-            macd_history = (self.technical_indicators['macd'] - self.technical_indicators['macd_signal']).iloc[i-historical_window:i]
-            
-            macd_threshold = config['macd']['threshold_std'] * macd_history.std()
-            macd_diff = macd - macd_signal
-            
-            macd_signal = 1 if macd_diff > macd_threshold else -1 if macd_diff < -macd_threshold else 0
-            macd_strength = abs(macd_diff) / macd_history.std()
-            
-            # Calculate Stochastic signals
-            stoch_k = self.technical_indicators['stoch_k'].iloc[i]
-            stoch_history = self.technical_indicators['stoch_k'].iloc[i-historical_window:i]
-            
-            oversold = config['stochastic']['oversold']
-            overbought = config['stochastic']['overbought']
-            
-            stoch_signal = 1 if stoch_k < oversold else -1 if stoch_k > overbought else 0
-            stoch_strength = min(abs(stoch_k - 50) / 50, 1.0)
-            
-            # Calculate weighted composite signal
-            weights = [
-                config['rsi']['weight'],
-                config['macd']['weight'],
-                config['stochastic']['weight']
-            ]
-            signals = [rsi_signal, macd_signal, stoch_signal]
-            strengths = [rsi_strength, macd_strength, stoch_strength]
-            
-            weighted_signal = sum(s * st * w for s, st, w in zip(signals, strengths, weights))
-            total_weight = sum(weights)
-            composite_signals[i] = weighted_signal / total_weight
-            
-            # Calculate confidence
-            volume_scale = self.data['volume'].iloc[i] / self.data['volume'].iloc[i-20:i].mean()
-            confidence_scale = 1 + 0.2 * volume_scale  # Simple volume-based scaling
-            confidence_values[i] = confidence_scale * min(
-                max(abs(composite_signals[i]), self.indicator_config['min_signal_confidence']),
-                1.0
-            )
+
+        def values(series):
+            # Float64 series are returned as views, without a copy
+            return series.to_numpy(dtype=np.float64, copy=False)
+
+        if length > historical_window:
+            # Rolling statistics over the bars strictly before each bar
+            macd_diff_series = self.technical_indicators['macd'] - self.technical_indicators['macd_signal']
+            macd_std = values(macd_diff_series.rolling(historical_window, min_periods=2).std().shift(1))[warm]
+            volume = values(self.data['volume'])
+            volume_mean = values(self.data['volume'].rolling(20, min_periods=1).mean().shift(1))[warm]
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                # RSI signals
+                rsi = values(self.technical_indicators['rsi'])[warm]
+                rsi_signal = np.where(rsi < rsi_oversold, 1,
+                                      np.where(rsi > rsi_overbought, -1, 0))
+                rsi_strength = np.abs((rsi - 50) / 50)
+
+                # MACD signals
+                macd_diff = values(macd_diff_series)[warm]
+                macd_threshold = macd_threshold_std * macd_std
+                macd_signal = np.where(macd_diff > macd_threshold, 1,
+                                       np.where(macd_diff < -macd_threshold, -1, 0))
+                macd_strength = np.abs(macd_diff) / macd_std
+
+                # Stochastic signals
+                stoch_k = values(self.technical_indicators['stoch_k'])[warm]
+                stoch_signal = np.where(stoch_k < stoch_oversold, 1,
+                                        np.where(stoch_k > stoch_overbought, -1, 0))
+                stoch_strength = np.minimum(np.abs(stoch_k - 50) / 50, 1.0)
+
+                # Weighted composite signal
+                weighted_signal = (
+                    rsi_signal * rsi_strength * weights[0]
+                    + macd_signal * macd_strength * weights[1]
+                    + stoch_signal * stoch_strength * weights[2]
+                )
+                composite_signals[warm] = weighted_signal / sum(weights)
+
+                # Confidence with simple volume-based scaling
+                confidence_scale = 1 + 0.2 * (volume[warm] / volume_mean)
+                confidence_values[warm] = confidence_scale * np.clip(
+                    np.abs(composite_signals[warm]), min_confidence, 1.0
+                )
         
         return {
             'composite_signal': composite_signals,
@@ -525,7 +560,7 @@ class MarketAnalyzer:
             ax.plot(self.data.index, self.technical_indicators['rsi'], 'b-', label='RSI')
             
             # Add dynamic thresholds
-            rsi_history = self.technical_indicators['rsi'].iloc[-100:]
+            rsi_history = self.technical_indicators['rsi'].to_numpy()[-100:]
             oversold = np.percentile(rsi_history, 100 - config['rsi']['threshold_percentile'])
             overbought = np.percentile(rsi_history, config['rsi']['threshold_percentile'])
             
@@ -643,7 +678,7 @@ class MarketAnalyzer:
         ax.set_title('Feature Importance in First Principal Component')
         ax.set_xlabel('Absolute Coefficient Value')
         
-    def _standardize_columns(self, data: pd.DataFrame) -> pd.DataFrame:
+    def standardize_columns(self, data: pd.DataFrame) -> pd.DataFrame:
         """Standardize column names from various data sources."""
         column_map = {
             'Close': 'close',
@@ -671,8 +706,8 @@ class MarketAnalyzer:
                 raise ValueError(f"No data available for {self.symbol}")
             
             # Standardize column names
-            self.data = self._standardize_columns(data)
+            self.data = self.standardize_columns(data)
             return self.data
         except Exception as e:
-            logger.error(f"Error fetching data for {self.symbol}: {str(e)}")
+            logger.error("Error fetching data for %s: %s", self.symbol, e)
             raise
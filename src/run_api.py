@@ -12,20 +12,28 @@ def main():
     project_root = Path(__file__).parent.parent
     sys.path.insert(0, str(project_root))
     
-    # Import the FastAPI app
-    from src.api.app import app  # Import here after path is set
-    
     port = int(os.getenv('API_PORT', 8000))
     host = os.getenv('API_HOST', '0.0.0.0')
+
+    # Reload is for development and needs a single process; otherwise run
+    # one worker process per core so CPU-bound analyses don't queue up
+    # behind each other in one event loop
+    reload = os.getenv('API_RELOAD', '1') == '1'
+    workers = 1 if reload else int(os.getenv('API_WORKERS', os.cpu_count() or 1))
     
-    # Run the server
+    # Run the server. uvicorn picks uvloop and httptools when installed
+    # (uvicorn[standard]). Each worker builds its own app through the
+    # factory, with the rate limiters and metrics of a non-test app.
     uvicorn.run(
-        app,  # Use the app instance directly
+        "src.api.app:create_app",
+        factory=True,
         host=host,
         port=port,
-        reload=True,
-        reload_dirs=[str(project_root / 'src')],
-        workers=1
+        reload=reload,
+        reload_dirs=[str(project_root / 'src')] if reload else None,
+        workers=workers,
+        loop='auto',
+        http='auto'
     )
 
 if __name__ == "__main__":
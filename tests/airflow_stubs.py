@@ -15,3 +15,6 @@ class DockerOperator:
         return other
     def __lshift__(self, other):
         return other
+
+class BashOperator(DockerOperator):
+    pass
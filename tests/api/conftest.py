@@ -7,6 +7,8 @@ import pandas as pd
 import numpy as np
 from unittest.mock import patch, MagicMock
 from decimal import Decimal
+from fastapi.testclient import TestClient
+from src.data_providers.base_provider import MarketDataProvider
 from src.api.models import (
     TimeWindowConfig, StateAnalysisConfig, SignalGenerationConfig,
     SignalThresholds, TechnicalIndicator, MarketState, TradingSignal,
@@ -129,3 +131,43 @@ def mock_analysis_result(mock_technical_indicators, mock_market_state, mock_trad
         latest_signal=mock_trading_signal,
         historical_signals=[mock_trading_signal]
     )
+
+
+class StaticProvider(MarketDataProvider):
+    """Provider serving a fixed synthetic daily series per symbol."""
+
+    async def fetch_data(self, symbol, start_date, end_date):
+        rng = np.random.default_rng(sum(map(ord, symbol)))
+        dates = pd.date_range(end='2024-06-28', periods=300, freq='D', tz='UTC')
+        close = 100 + np.cumsum(rng.normal(0, 1, len(dates)))
+        return pd.DataFrame({
+            'open': close + rng.normal(0, 0.5, len(dates)),
+            'high': close + 1,
+            'low': close - 1,
+            'close': close,
+            'volume': rng.uniform(1000000, 2000000, len(dates))
+        }, index=dates)
+
+    async def get_real_time_data(self, symbol):
+        return (await self.fetch_data(symbol, None, None)).tail(1)
+
+    def validate_symbol(self, symbol):
+        return True
+
+@pytest.fixture
+def analysis_client(monkeypatch):
+    """Test client for a test-mode app whose analyses run on StaticProvider data."""
+    import src.api.app as app_module
+    caches = (
+        app_module.market_analyzers,
+        app_module.market_data_cache,
+        app_module.indicator_cache,
+        app_module.analysis_cache
+    )
+    for cache in caches:
+        cache.clear()
+    monkeypatch.setattr(app_module, "_provider", StaticProvider())
+    with TestClient(app_module.create_app(test_mode=True, enable_queue=False, warm_pipeline=False)) as client:
+        yield client
+    for cache in caches:
+        cache.clear()
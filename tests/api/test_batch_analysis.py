@@ -0,0 +1,58 @@
+"""
+Tests for the batch analysis endpoint.
+"""
+
+
+def test_batch_analysis_multiple_symbols(analysis_client):
+    """Each symbol gets a result, in request order, without duplicates."""
+    response = analysis_client.post("/analyze/batch", json={
+        "symbols": ["MSFT", "AAPL", "MSFT"],
+        "indicators": ["RSI", "MACD"]
+    })
+    assert response.status_code == 200
+    results = response.json()
+    assert [result["symbol"] for result in results] == ["MSFT", "AAPL"]
+    for result in results:
+        names = {indicator["name"] for indicator in result["technical_indicators"]}
+        assert names <= {"RSI", "MACD"}
+        assert result["current_price"] > 0
+
+
+def test_batch_analysis_reversed_dates(analysis_client):
+    """A batch whose end time precedes its start time is rejected."""
+    response = analysis_client.post("/analyze/batch", json={
+        "symbols": ["AAPL", "MSFT"],
+        "start_time": "2024-06-01T00:00:00Z",
+        "end_time": "2024-05-01T00:00:00Z"
+    })
+    assert response.status_code == 422
+
+
+def test_batch_analysis_symbol_cap(analysis_client):
+    """At most 20 symbols are accepted per batch."""
+    symbols = [f"SYM{i}" for i in range(21)]
+    response = analysis_client.post("/analyze/batch", json={"symbols": symbols})
+    assert response.status_code == 422
+
+    response = analysis_client.post("/analyze/batch", json={
+        "symbols": symbols[:20],
+        "state_analysis": False
+    })
+    assert response.status_code == 200
+    assert len(response.json()) == 20
+
+
+def test_batch_analysis_unsupported_indicator(analysis_client, monkeypatch):
+    """Unsupported indicators fail the batch with a 400 before any fetch."""
+    import src.api.app as app_module
+
+    async def fail_fetch(*args, **kwargs):
+        raise AssertionError("market data fetched for an invalid batch")
+
+    monkeypatch.setattr(app_module.get_provider(), "fetch_data_batch", fail_fetch)
+    response = analysis_client.post("/analyze/batch", json={
+        "symbols": ["AAPL", "MSFT"],
+        "indicators": ["RSI", "FOO"]
+    })
+    assert response.status_code == 400
+    assert "FOO" in response.json()["detail"]
@@ -0,0 +1,44 @@
+"""
+Tests for the API startup and shutdown hooks.
+"""
+import threading
+
+from fastapi.testclient import TestClient
+
+import src.api.app as app_module
+
+
+def test_pipeline_warmup_disabled(monkeypatch):
+    """Apps created with warm_pipeline=False don't warm the pipeline."""
+    monkeypatch.setenv("WARM_ANALYSIS_PIPELINE", "1")
+    app = app_module.create_app(test_mode=True, enable_queue=False, warm_pipeline=False)
+    with TestClient(app):
+        assert not hasattr(app.state, "pipeline_warmup")
+
+
+def test_pipeline_warmup_on_by_default(monkeypatch):
+    """Without the argument or the variable, the pipeline is warmed."""
+    monkeypatch.delenv("WARM_ANALYSIS_PIPELINE", raising=False)
+    monkeypatch.setattr(app_module, "warm_analysis_pipeline", lambda: None)
+    app = app_module.create_app(test_mode=True, enable_queue=False)
+    with TestClient(app):
+        assert app.state.pipeline_warmup is not None
+
+
+def test_pipeline_warmup_cancelled_on_shutdown(monkeypatch):
+    """A warm-up still running at shutdown is cancelled and awaited."""
+    started, release = threading.Event(), threading.Event()
+
+    def slow_warmup():
+        started.set()
+        release.wait(5)
+
+    monkeypatch.setattr(app_module, "warm_analysis_pipeline", slow_warmup)
+    app = app_module.create_app(test_mode=True, enable_queue=False, warm_pipeline=True)
+    try:
+        with TestClient(app):
+            assert started.wait(5)
+            warmup = app.state.pipeline_warmup
+        assert warmup.cancelled()
+    finally:
+        release.set()
@@ -2,7 +2,7 @@
 Tests for API models.
 """
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 from pydantic import ValidationError
 
@@ -169,6 +169,15 @@ def test_trading_signal():
     assert signal.signal_type == "BUY"
     assert signal.confidence == 0.75
 
+    # Signal types are case-insensitive
+    signal_lower = TradingSignal(
+        timestamp=datetime.now(),
+        signal_type="buy",
+        confidence=0.75,
+        indicators=["RSI"]
+    )
+    assert signal_lower.signal_type == "BUY"
+
     # Test with state context
     state = MarketState(
         state_id=1,
@@ -269,6 +278,8 @@ def test_analysis_result():
     assert result.symbol == "AAPL"
     assert len(result.technical_indicators) == 1
     assert result.market_state.state_id == 1
+    # Naive timestamps are taken as UTC
+    assert result.timestamp.tzinfo == timezone.utc
 
     # Test invalid values
     with pytest.raises(ValidationError):
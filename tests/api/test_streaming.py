@@ -0,0 +1,102 @@
+"""
+Tests for the NDJSON streaming responses.
+"""
+import orjson
+
+import src.api.app as app_module
+
+# Thresholds under which nearly every warm bar carries an RSI signal
+SIGNAL_THRESHOLDS = {
+    "rsi_oversold": 49.0,
+    "rsi_overbought": 51.0,
+    "rsi_weight": 1.0,
+    "macd_weight": 0.0,
+    "stoch_weight": 0.0,
+    "min_signal_strength": 0.0,
+    "min_confidence": 0.0
+}
+
+
+def analysis_request(**overrides):
+    request = {
+        "symbol": "AAPL",
+        "indicators": ["RSI"],
+        "state_analysis": False,
+        "thresholds": SIGNAL_THRESHOLDS
+    }
+    request.update(overrides)
+    return request
+
+
+def parse_ndjson(response):
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.content.endswith(b"\n")
+    return [orjson.loads(line) for line in response.content.splitlines()]
+
+
+def test_analyze_explicit_stream(analysis_client):
+    """stream=true sends the result first, then one signal per line, newest first."""
+    response = analysis_client.post("/analyze?stream=true", json=analysis_request())
+    assert response.status_code == 200
+    head, *signals = parse_ndjson(response)
+
+    assert head["symbol"] == "AAPL"
+    assert "signals" not in head
+    assert head["technical_indicators"][0]["name"] == "RSI"
+
+    assert signals
+    for signal in signals:
+        assert signal["signal_type"] in ("BUY", "SELL")
+        assert 0 <= signal["confidence"] <= 1
+        assert signal["indicators"] == ["RSI"]
+        assert signal["timestamp"].endswith("Z")
+    timestamps = [signal["timestamp"] for signal in signals]
+    assert timestamps == sorted(timestamps, reverse=True)
+
+
+def test_analyze_streams_past_threshold(analysis_client, monkeypatch):
+    """Results with more signals than the threshold are streamed by default."""
+    monkeypatch.setattr(app_module, "STREAM_SIGNALS_THRESHOLD", 5)
+
+    response = analysis_client.post("/analyze", json=analysis_request())
+    assert response.status_code == 200
+    _, *signals = parse_ndjson(response)
+    assert len(signals) > 5
+
+    # An explicit stream=false always returns a single JSON document
+    response = analysis_client.post("/analyze?stream=false", json=analysis_request())
+    assert response.headers["content-type"].startswith("application/json")
+    assert len(response.json()["signals"]) == len(signals)
+
+
+def test_analyze_not_streamed_below_threshold(analysis_client, monkeypatch):
+    """Results within the threshold are returned as JSON."""
+    monkeypatch.setattr(app_module, "STREAM_SIGNALS_THRESHOLD", 10_000)
+
+    response = analysis_client.post("/analyze", json=analysis_request())
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/json")
+    assert response.json()["signals"]
+
+
+def test_signal_stream(analysis_client):
+    """The signal stream sends every signal oldest first, one per line."""
+    response = analysis_client.get("/analyze/AAPL/signals/stream", params=SIGNAL_THRESHOLDS)
+    assert response.status_code == 200
+    signals = parse_ndjson(response)
+
+    assert signals
+    for signal in signals:
+        assert set(signal) == {"timestamp", "signal_type", "confidence"}
+        assert signal["signal_type"] in ("BUY", "SELL")
+    timestamps = [signal["timestamp"] for signal in signals]
+    assert timestamps == sorted(timestamps)
+
+
+def test_signal_stream_invalid_thresholds(analysis_client):
+    """Inconsistent query thresholds are rejected before any analysis."""
+    response = analysis_client.get(
+        "/analyze/AAPL/signals/stream",
+        params={"rsi_oversold": 80, "rsi_overbought": 20}
+    )
+    assert response.status_code == 422
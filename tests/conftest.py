@@ -25,7 +25,7 @@ def event_loop():
 @pytest.fixture
 def test_client():
     """Create test client."""
-    app = create_app(test_mode=True)
+    app = create_app(test_mode=True, warm_pipeline=False)
     with TestClient(app) as client:
         yield client
 
@@ -0,0 +1,125 @@
+"""Tests for the concurrent request limiter middleware."""
+import asyncio
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.api.middleware import ConcurrentRequestLimiter
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis calls the limiter makes."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.slots = {}
+        self.refreshes = 0
+
+    def register_script(self, script):
+        def acquire(keys, args):
+            if self.fail:
+                raise ConnectionError("Redis is down")
+            slots = self.slots.setdefault(keys[0], {})
+            if len(slots) >= args[2]:
+                return 0
+            slots[args[3]] = args[1]
+            return 1
+        return acquire
+
+    def zrem(self, key, member):
+        self.slots.get(key, {}).pop(member, None)
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class Pipeline:
+            def zadd(self, key, mapping, xx=False):
+                slots = redis.slots.get(key, {})
+                for member, score in mapping.items():
+                    if member in slots:
+                        slots[member] = score
+                        redis.refreshes += 1
+
+            def expire(self, key, ttl):
+                pass
+
+            def execute(self):
+                pass
+
+        return Pipeline()
+
+
+def make_client(redis, **kwargs):
+    app = FastAPI()
+    app.add_middleware(
+        ConcurrentRequestLimiter,
+        redis_client=SimpleNamespace(test_mode=False, redis_client=redis),
+        max_concurrent=1,
+        **kwargs
+    )
+
+    @app.get("/analyze")
+    async def analyze():
+        return {"status": "ok"}
+
+    @app.get("/analyze/slow")
+    async def analyze_slow():
+        await asyncio.sleep(0.2)
+        return {"status": "ok"}
+
+    @app.get("/analyze/fail")
+    async def analyze_fail():
+        raise RuntimeError("analysis failed")
+
+    @app.get("/other")
+    async def other():
+        return {"status": "ok"}
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_admits_and_releases():
+    """A request under the limit is admitted and frees its slot afterwards."""
+    redis = FakeRedis()
+    client = make_client(redis)
+    assert client.get("/analyze").status_code == 200
+    assert redis.slots["concurrent:testclient"] == {}
+    # The freed slot admits the next request
+    assert client.get("/analyze").status_code == 200
+
+
+def test_rejects_over_limit():
+    """A client already holding every slot gets a 429."""
+    redis = FakeRedis()
+    redis.slots["concurrent:testclient"] = {"other-request": 0}
+    client = make_client(redis)
+
+    response = client.get("/analyze")
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "1"
+    assert response.json() == {"error": "Too many concurrent requests"}
+    # Paths outside the limited prefixes are not counted
+    assert client.get("/other").status_code == 200
+
+
+def test_releases_when_app_fails():
+    """The slot is released even when the request raises."""
+    redis = FakeRedis()
+    client = make_client(redis)
+    assert client.get("/analyze/fail").status_code == 500
+    assert redis.slots["concurrent:testclient"] == {}
+
+
+def test_fails_open_without_redis():
+    """Requests are served when Redis can't be reached."""
+    client = make_client(FakeRedis(fail=True))
+    assert client.get("/analyze").status_code == 200
+
+
+def test_refreshes_slot_of_long_request():
+    """A request outliving a third of the TTL refreshes its slot."""
+    redis = FakeRedis()
+    client = make_client(redis, slot_ttl=0.05)
+    assert client.get("/analyze/slow").status_code == 200
+    assert redis.refreshes > 0
+    assert redis.slots["concurrent:testclient"] == {}
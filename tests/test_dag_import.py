@@ -7,17 +7,20 @@ import importlib.util
 import pytest
 import sys
 import types
+from pathlib import Path
+
+DAGS_DIR = os.path.join(os.path.dirname(__file__), '..', 'dags')
 
 def get_dag_files():
-    dags_dir = os.path.join(os.path.dirname(__file__), '..', 'dags')
+    # Underscore-prefixed modules are shared helpers, not DAG files
     return [
-        os.path.join(dags_dir, f)
-        for f in os.listdir(dags_dir)
-        if f.endswith('.py') and not f.startswith('__')
+        os.path.join(DAGS_DIR, f)
+        for f in os.listdir(DAGS_DIR)
+        if f.endswith('.py') and not f.startswith('_')
     ]
 
 @pytest.mark.parametrize('dag_file', get_dag_files())
-def test_dag_import(dag_file):
+def test_dag_import(dag_file, monkeypatch):
     # Monkeypatch airflow modules with stubs
     stub_path = Path(__file__).parent / 'airflow_stubs.py'
     stub = types.ModuleType('airflow_stubs')
@@ -30,6 +33,13 @@ def test_dag_import(dag_file):
     docker_mod = types.ModuleType('airflow.providers.docker.operators.docker')
     docker_mod.DockerOperator = stub.DockerOperator
     sys.modules['airflow.providers.docker.operators.docker'] = docker_mod
+    # Create fake airflow.operators.bash module
+    bash_mod = types.ModuleType('airflow.operators.bash')
+    bash_mod.BashOperator = stub.BashOperator
+    sys.modules['airflow.operators.bash'] = bash_mod
+    # Airflow puts the dags folder on sys.path so DAG files can share helpers
+    monkeypatch.syspath_prepend(DAGS_DIR)
+    sys.modules.pop('_ingest_factory', None)
     # Now import the DAG file
     try:
         spec = importlib.util.spec_from_file_location('dag_module', dag_file)
@@ -73,5 +73,44 @@ class TestMarketAnalyzer(unittest.TestCase):
         self.assertIn('state_characteristics', signals)
         self.assertIn('current_state', signals)
 
+class TestStateModelReuse(unittest.TestCase):
+    """Reuse of the fitted state model across analyzer resets"""
+
+    def setUp(self):
+        self.analyzer = MarketAnalyzer('AAPL', provider=object())
+        rng = np.random.default_rng(0)
+        index = pd.date_range(end=datetime(2024, 1, 31), periods=1500, freq='min')
+        close = 100 + np.cumsum(rng.normal(0, 1, len(index)))
+        self.data = pd.DataFrame({
+            'open': close,
+            'high': close + 1,
+            'low': close - 1,
+            'close': close,
+            'volume': rng.uniform(1e6, 2e6, len(index))
+        }, index=index)
+
+    def test_reused_for_appended_bars(self):
+        """A window extended by a few bars only re-predicts states"""
+        self.analyzer.reset(self.data.iloc[:-2])
+        self.analyzer.identify_market_states(n_states=3)
+        model = self.analyzer._state_model
+
+        self.analyzer.reset(self.data)
+        self.analyzer.identify_market_states(n_states=3)
+        self.assertIs(self.analyzer._state_model, model)
+        self.assertEqual(len(self.analyzer.states), len(self.data))
+
+    def test_refit_for_shorter_window(self):
+        """A window ending at the same bar but starting later is refitted"""
+        self.analyzer.reset(self.data)
+        self.analyzer.identify_market_states(n_states=3)
+        model = self.analyzer._state_model
+
+        tail = self.data.iloc[-120:]
+        self.analyzer.reset(tail)
+        self.analyzer.identify_market_states(n_states=3)
+        self.assertIsNot(self.analyzer._state_model, model)
+        self.assertEqual(self.analyzer._state_model['fitted_from'], tail.index[0])
+
 if __name__ == '__main__':
     unittest.main()
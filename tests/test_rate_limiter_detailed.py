@@ -79,5 +79,14 @@ def test_rate_limit_boundary(test_client, test_app):
     error_response = response.json()
     assert error_response["error"] == "Rate limit exceeded"
 
+def test_exempt_paths_match_whole_segments():
+    """Only exempt paths and paths below them skip the limit."""
+    rate_limiter = RateLimiter(FastAPI(), test_mode=True)
+
+    for path in ("/health", "/health/live", "/metrics"):
+        assert rate_limiter._is_exempt(path)
+    for path in ("/healthz", "/metrics-anything", "/health/../analyze", "/analyze"):
+        assert not rate_limiter._is_exempt(path)
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,184 @@
+"""Tests for the Redis backed path of the rate limiter."""
+import asyncio
+import math
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.api.middleware import RateLimiter
+from src.api.middleware import rate_limiter as rate_limiter_module
+
+
+class FakeRedis:
+    """Runs the sliding window script's logic against in-memory hashes."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.hashes = {}
+        self.executions = 0
+
+    def register_script(self, script):
+        def sliding_window(keys, args, client):
+            client.queued.append((keys[0], args))
+        return sliding_window
+
+    def pipeline(self, transaction=True):
+        assert transaction is False
+        return FakePipeline(self)
+
+    def run(self, key, args):
+        window, bucket, previous_bucket, previous_weight, limit, old_bucket = args
+        counts = self.hashes.setdefault(key, {})
+        current = counts.get(bucket, 0)
+        count = math.floor(counts.get(previous_bucket, 0) * previous_weight) + current
+        if count >= limit:
+            return [0, count]
+        counts[bucket] = current + 1
+        if current == 0:
+            counts.pop(old_bucket, None)
+        return [1, count + 1]
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queued = []
+
+    def execute(self):
+        self.redis.executions += 1
+        if self.redis.fail:
+            raise ConnectionError("Redis is down")
+        return [self.redis.run(key, args) for key, args in self.queued]
+
+
+def redis_client(redis):
+    return SimpleNamespace(test_mode=False, redis_client=redis)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable wall clock for the Redis window buckets."""
+    now = SimpleNamespace(value=60 * 1000 + 30.0)
+    monkeypatch.setattr(
+        rate_limiter_module, "time",
+        SimpleNamespace(time=lambda: now.value, monotonic=time.monotonic)
+    )
+    return now
+
+
+def make_client(redis):
+    app = FastAPI()
+    app.add_middleware(RateLimiter, requests_per_minute=10, redis_client=redis_client(redis))
+
+    @app.get("/test")
+    def test_endpoint():
+        return {"status": "ok"}
+
+    return TestClient(app)
+
+
+def test_limit_across_window_boundary(clock):
+    """The previous window's count is weighted by its remaining overlap."""
+    client = make_client(FakeRedis())
+
+    for remaining in range(9, -1, -1):
+        response = client.get("/test")
+        assert response.status_code == 200
+        assert int(response.headers["X-RateLimit-Remaining"]) == remaining
+    response = client.get("/test")
+    assert response.status_code == 429
+    # Rejected until the next window starts, 30s later
+    assert int(response.headers["Retry-After"]) == 30
+
+    # 15s into the next window, 75% of the previous 10 requests still count
+    clock.value = 60 * 1001 + 15.0
+    for remaining in (2, 1, 0):
+        response = client.get("/test")
+        assert response.status_code == 200
+        assert int(response.headers["X-RateLimit-Remaining"]) == remaining
+    response = client.get("/test")
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) == 45
+
+
+def test_old_window_dropped(clock):
+    """The first request of a window removes the counter two windows back."""
+    redis = FakeRedis()
+    client = make_client(redis)
+    client.get("/test")
+    clock.value += 60
+    client.get("/test")
+    clock.value += 60
+    client.get("/test")
+    assert sorted(redis.hashes["ratelimit:testclient"]) == [1001, 1002]
+
+
+def test_checks_batched_into_one_pipeline(clock):
+    """Concurrent checks share a single pipeline round trip."""
+    redis = FakeRedis()
+    limiter = RateLimiter(FastAPI(), requests_per_minute=10, redis_client=redis_client(redis))
+
+    async def check_all():
+        return await asyncio.gather(*(limiter._check_redis_batched("client") for _ in range(3)))
+
+    results = asyncio.run(check_all())
+    assert [count for _, count, _ in results] == [1, 2, 3]
+    assert all(allowed for allowed, _, _ in results)
+    assert redis.executions == 1
+
+
+def test_pipeline_error_fails_every_waiter(clock):
+    """A failing pipeline resolves every queued future with its error."""
+    redis = FakeRedis(fail=True)
+    limiter = RateLimiter(FastAPI(), requests_per_minute=10, redis_client=redis_client(redis))
+
+    async def check_all():
+        return await asyncio.gather(
+            *(limiter._check_redis_batched("client") for _ in range(3)),
+            return_exceptions=True
+        )
+
+    results = asyncio.run(check_all())
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert limiter._pending == []
+
+
+def test_falls_back_to_local_window(clock):
+    """Requests are still limited in process while Redis is down."""
+    client = make_client(FakeRedis(fail=True))
+    response = client.get("/test")
+    assert response.status_code == 200
+    assert int(response.headers["X-RateLimit-Remaining"]) == 9
+
+
+def test_aclose_sends_queued_checks(clock):
+    """Checks queued at shutdown are still sent before the flusher stops."""
+    redis = FakeRedis()
+    limiter = RateLimiter(FastAPI(), requests_per_minute=10, redis_client=redis_client(redis))
+
+    async def check_then_close():
+        check = asyncio.ensure_future(limiter._check_redis_batched("client"))
+        await asyncio.sleep(0)
+        await limiter.aclose()
+        return check
+
+    check = asyncio.run(check_then_close())
+    assert check.result()[:2] == (True, 1)
+    assert limiter._flusher.done()
+    assert redis.executions == 1
+
+
+def test_closed_at_app_shutdown(monkeypatch):
+    """The limiter is closed when the app's lifespan shuts down."""
+    limiter = RateLimiter(FastAPI(), requests_per_minute=10, redis_client=redis_client(FakeRedis()))
+    closed = []
+
+    async def record_close():
+        closed.append(True)
+
+    monkeypatch.setattr(limiter, "aclose", record_close)
+    with TestClient(limiter):
+        assert closed == []
+    assert closed == [True]
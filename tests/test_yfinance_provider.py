@@ -0,0 +1,50 @@
+"""
+Tests for the YFinance market data provider.
+"""
+import asyncio
+
+import pandas as pd
+import pytest
+
+import src.data_providers.yfinance_provider as yfinance_module
+from src.data_providers.yfinance_provider import YFinanceProvider
+
+
+def bars(index):
+    return pd.DataFrame({
+        'Open': 1.0, 'High': 2.0, 'Low': 0.5, 'Close': 1.5, 'Volume': 100.0
+    }, index=index)
+
+
+@pytest.fixture
+def exchange_index():
+    return pd.date_range('2024-01-02', periods=3, freq='D', tz='America/New_York')
+
+
+def test_single_and_batch_fetch_share_timezone(monkeypatch, exchange_index):
+    """Both fetch paths index the same bars in UTC."""
+    calls = {}
+
+    class FakeTicker:
+        def __init__(self, symbol):
+            pass
+
+        def history(self, **kwargs):
+            return bars(exchange_index)
+
+    def fake_download(symbols, **kwargs):
+        calls.update(kwargs)
+        return pd.concat({symbol: bars(exchange_index) for symbol in symbols}, axis=1)
+
+    monkeypatch.setattr(yfinance_module.yf, "Ticker", FakeTicker)
+    monkeypatch.setattr(yfinance_module.yf, "download", fake_download)
+    provider = YFinanceProvider()
+
+    single = asyncio.run(provider.fetch_data("AAPL", None, None))
+    batch = asyncio.run(provider.fetch_data_batch(["AAPL", "MSFT"], None, None))
+
+    assert calls["ignore_tz"] is False
+    assert str(single.index.tz) == "UTC"
+    for frame in batch.values():
+        pd.testing.assert_index_equal(frame.index, single.index)
+        assert list(frame.columns) == list(single.columns)